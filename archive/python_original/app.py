@@ -2,18 +2,31 @@
 """Gradio web UI for the OHdio audiobook downloader."""
 
 import asyncio
+import atexit
+import concurrent.futures
 import logging
+import os
 import sys
+import tempfile
 import zipfile
-import io
+import shutil
 import threading
 import time
-import queue
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Tuple, Dict
+import re
+from typing import List, NamedTuple, Optional, Dict
 import gradio as gr
 
+# Use uvloop's libuv-backed event loop where available (not on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -24,37 +37,93 @@ from src.downloader.ytdlp_downloader import YtDlpDownloader
 
 
 # Global state
-LOG_QUEUE = queue.Queue()
-DOWNLOAD_STATE = {
-    'in_progress': False,
-    'stop_requested': False,
-    'thread': None,
-    'result': None,
-    'downloader': None,
-    'log_handler': None
+# Bounded fallback buffer for log records emitted while no job is streaming
+LOG_BUFFER = deque(maxlen=2000)
+LOG_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
+class DownloadState:
+    """Shared state for the active download job."""
+
+    in_progress: bool = False
+    stop_requested: bool = False
+    thread: Optional[threading.Thread] = None
+    result: Optional[dict] = None
+    downloader: Optional['OHdioDownloader'] = None
+    log_handler: Optional[logging.Handler] = None
+    log_queue: Optional[asyncio.Queue] = None
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+STATE = DownloadState()
+
+
+def _start_background_loop() -> asyncio.AbstractEventLoop:
+    """Start a persistent asyncio event loop in a daemon thread.
+
+    All download jobs run on this single loop, so the downloader's HTTP
+    sessions, DNS cache, and TLS connections persist across jobs instead
+    of paying loop and thread creation costs on every click.
+    """
+    loop = asyncio.new_event_loop()
+
+    # The default executor caps at min(32, cpu_count + 4), which is too small
+    # for many simultaneous HTTP/disk-bound yt-dlp calls run via run_in_executor
+    loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(
+        max_workers=int(os.getenv("OHDIO_THREAD_POOL", "64")),
+        thread_name_prefix="ohdio-io"
+    ))
+
+    def run_loop():
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    thread = threading.Thread(target=run_loop, name="download-loop", daemon=True)
+    thread.start()
+    STATE.thread = thread
+    return loop
+
+
+BG_LOOP = _start_background_loop()
+
+
+# Log level emoji shared by all emits, avoiding a dict literal per record
+_LEVEL_EMOJI = {
+    'DEBUG': '🔍',
+    'INFO': 'ℹ️',
+    'WARNING': '⚠️',
+    'ERROR': '❌',
+    'CRITICAL': '🚨'
 }
+_GET_EMOJI = _LEVEL_EMOJI.get
 
 
 class GradioLogHandler(logging.Handler):
     """Custom logging handler that writes to queue for Gradio display."""
 
+    __slots__ = ()
+
     def emit(self, record):
         """Emit a log record."""
         try:
             msg = self.format(record)
-            timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
-
-            # Determine log level emoji
-            level_emoji = {
-                'DEBUG': '🔍',
-                'INFO': 'ℹ️',
-                'WARNING': '⚠️',
-                'ERROR': '❌',
-                'CRITICAL': '🚨'
-            }.get(record.levelname, 'ℹ️')
-
-            log_entry = f"[{timestamp}] {level_emoji} {msg}"
-            LOG_QUEUE.put(log_entry)
+            # time.strftime is C-implemented and avoids datetime allocation
+            timestamp = time.strftime("%H:%M:%S", time.localtime(record.created))
+
+            log_entry = f"[{timestamp}] {_GET_EMOJI(record.levelname, 'ℹ️')} {msg}"
+
+            # Push directly onto the asyncio queue of the active streaming
+            # handler if one is running, falling back to the thread-safe
+            # queue otherwise.
+            loop = STATE.loop
+            log_queue = STATE.log_queue
+            if loop is not None and log_queue is not None:
+                loop.call_soon_threadsafe(log_queue.put_nowait, log_entry)
+            else:
+                with LOG_LOCK:
+                    LOG_BUFFER.append(log_entry)
         except Exception:
             pass
 
@@ -67,53 +136,104 @@ def get_config_path() -> str:
     return str(config_path)
 
 
+# Cached Config instance, invalidated when config.json changes on disk
+_CONFIG_CACHE = {'mtime': 0, 'config': None}
+
+
+def get_config() -> Config:
+    """Get the application config, re-parsing config.json only when it changes."""
+    config_file = get_config_path()
+    mtime = os.stat(config_file).st_mtime_ns
+    if _CONFIG_CACHE['config'] is None or _CONFIG_CACHE['mtime'] != mtime:
+        _CONFIG_CACHE['config'] = Config.from_file(config_file)
+        _CONFIG_CACHE['mtime'] = mtime
+    return _CONFIG_CACHE['config']
+
+
 def initialize_downloader():
     """Initialize the OHdio downloader."""
-    if DOWNLOAD_STATE['downloader'] is None:
+    if STATE.downloader is None:
         config_file = get_config_path()
         # Use /data/logs for Docker volume, fallback to logs/ for local development
         log_path = "/data/logs/scraper.log" if Path("/data/logs").exists() else "logs/scraper.log"
         setup_logging(log_level="INFO", log_file=log_path, console_output=False, json_format=False)
-        DOWNLOAD_STATE['downloader'] = OHdioDownloader(config_file)
+        STATE.downloader = OHdioDownloader(config_file)
 
         # Add custom log handler
-        if DOWNLOAD_STATE['log_handler'] is None:
-            DOWNLOAD_STATE['log_handler'] = GradioLogHandler()
-            DOWNLOAD_STATE['log_handler'].setLevel(logging.INFO)
+        if STATE.log_handler is None:
+            STATE.log_handler = GradioLogHandler()
+            STATE.log_handler.setLevel(logging.INFO)
             formatter = logging.Formatter('%(message)s')
-            DOWNLOAD_STATE['log_handler'].setFormatter(formatter)
+            STATE.log_handler.setFormatter(formatter)
 
             # Add handler to root logger
             root_logger = logging.getLogger()
-            root_logger.addHandler(DOWNLOAD_STATE['log_handler'])
+            root_logger.addHandler(STATE.log_handler)
 
 
-def get_downloaded_files() -> List[Path]:
-    """Get list of downloaded audiobook files."""
-    config_file = get_config_path()
-    config = Config.from_file(config_file)
+# Cache for get_downloaded_files(), keyed on (output_dir, dir mtime) so
+# repeat calls cost a single stat() on the directory itself
+_FILES_CACHE = {'key': None, 'files': []}
+
+
+class FileEntry(NamedTuple):
+    """Directory entry for a downloaded file, with cached stat data."""
+
+    path: Path
+    mtime: float
+    size: int
+    stem_lower: str
+
+    @property
+    def stem(self) -> str:
+        return self.path.stem
+
+
+def get_downloaded_files() -> List[FileEntry]:
+    """Get list of downloaded audiobook files with cached stat metadata."""
+    config = get_config()
     output_dir = Path(config.output_directory)
 
     if not output_dir.exists():
         output_dir.mkdir(parents=True, exist_ok=True)
         return []
 
-    # Get all MP3 files, sorted by modification time (newest first)
-    files = sorted(
-        output_dir.glob("*.mp3"),
-        key=lambda x: x.stat().st_mtime,
-        reverse=True
-    )
+    # Any file added/removed bumps the directory mtime, invalidating the key
+    cache_key = (str(output_dir), output_dir.stat().st_mtime_ns)
+    if _FILES_CACHE['key'] == cache_key:
+        return _FILES_CACHE['files']
+
+    # scandir carries stat data with each entry, avoiding a stat() per file
+    with os.scandir(output_dir) as entries:
+        files = [
+            FileEntry(
+                Path(entry.path),
+                entry.stat().st_mtime,
+                entry.stat().st_size,
+                entry.name[:-4].lower()
+            )
+            for entry in entries
+            if entry.is_file() and entry.name.endswith('.mp3')
+        ]
+
+    # Sort by modification time (newest first)
+    files.sort(key=lambda entry: entry.mtime, reverse=True)
+
+    _FILES_CACHE['key'] = cache_key
+    _FILES_CACHE['files'] = files
     return files
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes <= 0:
+        return "0.0 B"
+    # bit_length() picks the unit directly, replacing the division loop
+    index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 
 def format_datetime(timestamp: float) -> str:
@@ -122,71 +242,64 @@ def format_datetime(timestamp: float) -> str:
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
+_OHDIO_RE = re.compile(r'(?:ici\.)?radio-canada\.ca/ohdio', re.IGNORECASE)
+
+
 def is_ohdio_url(url: str) -> bool:
     """Check if URL is an OHdio URL."""
-    ohdio_domains = [
-        'ici.radio-canada.ca/ohdio',
-        'radio-canada.ca/ohdio'
-    ]
-    return any(domain in url.lower() for domain in ohdio_domains)
-
+    return _OHDIO_RE.search(url) is not None
 
-def get_logs_text() -> str:
-    """Get all logs from queue as formatted text."""
-    logs = []
-    while not LOG_QUEUE.empty():
-        try:
-            logs.append(LOG_QUEUE.get_nowait())
-        except queue.Empty:
-            break
-    return "\n".join(logs) if logs else ""
 
+def create_zip_of_files(file_paths: List[Path], out_path: Path) -> None:
+    """Create a ZIP file on disk containing the selected audiobooks.
 
-def create_zip_of_files(file_paths: List[Path]) -> bytes:
-    """Create a ZIP file containing the selected audiobooks."""
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+    Entries are streamed in 8 MiB blocks so the archive never has to be
+    materialized in memory. MP3 payloads are already entropy-coded, so
+    entries are stored uncompressed rather than wasting CPU on deflate.
+    """
+    with zipfile.ZipFile(out_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as zip_file:
         for file_path in file_paths:
-            zip_file.write(file_path, arcname=file_path.name)
-
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+            with open(file_path, 'rb') as src, zip_file.open(file_path.name, 'w') as dest:
+                shutil.copyfileobj(src, dest, length=8 << 20)
 
 
 async def download_generic_url(url: str):
     """Download from any URL supported by yt-dlp."""
     try:
-        config_file = get_config_path()
-        config = Config.from_file(config_file)
+        config = get_config()
         downloader = YtDlpDownloader(config)
+        try:
+            # Get media info first
+            logging.info("Extracting media information...")
+            media_info = downloader.get_media_info(url)
 
-        # Get media info first
-        logging.info("Extracting media information...")
-        media_info = downloader.get_media_info(url)
-
-        if not media_info:
-            logging.error("Failed to extract media information from URL")
-            return False
+            if not media_info:
+                logging.error("Failed to extract media information from URL")
+                return False
 
-        title = media_info.get('title', 'Unknown Title')
-        uploader = media_info.get('uploader', 'Unknown Uploader')
+            title = media_info.get('title', 'Unknown Title')
+            uploader = media_info.get('uploader', 'Unknown Uploader')
 
-        logging.info(f"Detected: {title} by {uploader}")
+            logging.info(f"Detected: {title} by {uploader}")
 
-        # Download the file
-        logging.info(f"Downloading {title}...")
-        output_path = await downloader.download_audiobook(
-            playlist_url=url,
-            title=title,
-            author=uploader
-        )
+            # Download the file
+            logging.info(f"Downloading {title}...")
+            output_path = await downloader.download_audiobook(
+                playlist_url=url,
+                title=title,
+                author=uploader
+            )
 
-        if output_path:
-            logging.info(f"✅ Successfully downloaded: {title}")
-            return True
-        else:
-            logging.error("Download failed")
-            return False
+            if output_path:
+                logging.info(f"✅ Successfully downloaded: {title}")
+                return True
+            else:
+                logging.error("Download failed")
+                return False
+        finally:
+            # Each invocation builds a fresh downloader on the persistent
+            # background loop; without this its worker threads leak
+            downloader.close()
 
     except Exception as e:
         logging.error(f"Error: {e}")
@@ -234,117 +347,140 @@ async def _download_category_async(category_url: Optional[str], downloader):
     return result
 
 
-def _run_async_in_thread(coro, result_container):
-    """Run async coroutine in a new event loop."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        result = loop.run_until_complete(coro)
-        result_container['result'] = result
-        result_container['completed'] = True
-    except Exception as e:
-        result_container['error'] = str(e)
-        result_container['completed'] = True
-    finally:
-        loop.close()
+# Sentinel pushed onto the log queue when the job's future completes
+_STREAM_DONE = object()
 
 
-def start_download_single(url: str) -> str:
-    """Start downloading a single audiobook."""
-    if not url:
-        return "❌ Please enter a URL"
+async def _run_download_stream(coro):
+    """Run a download coroutine on the background loop and stream UI updates.
 
-    if DOWNLOAD_STATE['in_progress']:
-        return "⚠️ Download already in progress"
+    Yields (status, logs, stats, timer) tuples as log records arrive, so the
+    UI is only updated while a job is actually running.
+    """
+    # Clear stale logs from any previous run
+    with LOG_LOCK:
+        LOG_BUFFER.clear()
 
-    # Clear logs
-    while not LOG_QUEUE.empty():
-        try:
-            LOG_QUEUE.get_nowait()
-        except queue.Empty:
-            break
-
-    # Initialize downloader
-    initialize_downloader()
+    log_queue = asyncio.Queue()
+    stream_loop = asyncio.get_running_loop()
 
     # Set state
-    DOWNLOAD_STATE['in_progress'] = True
-    DOWNLOAD_STATE['stop_requested'] = False
     result_container = {'completed': False, 'result': None, 'error': None}
-    DOWNLOAD_STATE['result'] = result_container
-
-    # Start download thread
-    thread = threading.Thread(
-        target=_run_async_in_thread,
-        args=(_download_single_async(url, DOWNLOAD_STATE['downloader']), result_container),
-        daemon=True
-    )
-    thread.start()
-    DOWNLOAD_STATE['thread'] = thread
+    with STATE.lock:
+        STATE.in_progress = True
+        STATE.stop_requested = False
+        STATE.log_queue = log_queue
+        STATE.loop = stream_loop
+        STATE.result = result_container
 
-    return "⏳ Download started... Check logs below for progress"
+    # Submit the job to the persistent background loop
+    future = asyncio.run_coroutine_threadsafe(coro, BG_LOOP)
 
-
-def start_download_category(category_url: Optional[str] = None) -> str:
-    """Start downloading a category."""
-    if DOWNLOAD_STATE['in_progress']:
-        return "⚠️ Download already in progress"
-
-    # Clear logs
-    while not LOG_QUEUE.empty():
+    def _on_done(fut):
         try:
-            LOG_QUEUE.get_nowait()
-        except queue.Empty:
-            break
-
-    # Initialize downloader
-    initialize_downloader()
+            result_container['result'] = fut.result()
+        except Exception as e:
+            result_container['error'] = str(e)
+        result_container['completed'] = True
+        # Wake the stream loop immediately rather than letting it discover
+        # completion on its next poll; the stream may already be gone if
+        # the client disconnected, in which case there is nobody left to
+        # wake
+        try:
+            stream_loop.call_soon_threadsafe(log_queue.put_nowait, _STREAM_DONE)
+        except RuntimeError:
+            pass
 
-    # Set state
-    DOWNLOAD_STATE['in_progress'] = True
-    DOWNLOAD_STATE['stop_requested'] = False
-    result_container = {'completed': False, 'result': None, 'error': None}
-    DOWNLOAD_STATE['result'] = result_container
+    future.add_done_callback(_on_done)
 
-    # Start download thread
-    thread = threading.Thread(
-        target=_run_async_in_thread,
-        args=(_download_category_async(category_url if category_url else None, DOWNLOAD_STATE['downloader']), result_container),
-        daemon=True
-    )
-    thread.start()
-    DOWNLOAD_STATE['thread'] = thread
+    # Bounded sliding window: the UI frame size stays constant on long jobs
+    log_lines = deque(maxlen=500)
+    try:
+        yield (
+            "⏳ Download started... Check logs below for progress",
+            "",
+            get_stats(),
+            gr.Timer(active=True)
+        )
 
-    return "⏳ Category download started... Check logs below for progress"
+        # Stream log records until the done callback posts the sentinel;
+        # each iteration blocks on the queue, so there are no timeout
+        # wakeups
+        finished = False
+        while not finished:
+            entry = await log_queue.get()
+            if entry is _STREAM_DONE:
+                break
+            log_lines.append(entry)
+            while not log_queue.empty():
+                entry = log_queue.get_nowait()
+                if entry is _STREAM_DONE:
+                    finished = True
+                else:
+                    log_lines.append(entry)
+            yield (
+                "⏳ Download in progress...",
+                "\n".join(log_lines),
+                get_stats(),
+                gr.Timer(active=True)
+            )
 
+        # Drain trailing records emitted just before completion
+        while not log_queue.empty():
+            entry = log_queue.get_nowait()
+            if entry is not _STREAM_DONE:
+                log_lines.append(entry)
+    finally:
+        # Runs even when the client disconnects and Gradio closes the
+        # generator mid-job: without it in_progress stays stuck on True
+        # and the log handler keeps filling an orphaned queue for the
+        # rest of the background job
+        with STATE.lock:
+            STATE.in_progress = False
+            STATE.log_queue = None
+            STATE.loop = None
+            STATE.result = None
+
+    status = ""
+    result_data = result_container.get('result') or {}
+    if result_data.get('success'):
+        status = result_data['success']
+    if result_data.get('error'):
+        status = result_data['error']
+    if result_container.get('error'):
+        status = f"❌ Thread error: {result_container['error']}"
+
+    yield status, "\n".join(log_lines), get_stats(), gr.Timer(active=False)
+
+
+async def start_download_single(url: str):
+    """Start downloading a single audiobook, streaming progress to the UI."""
+    if not url:
+        yield "❌ Please enter a URL", "", get_stats(), gr.Timer(active=False)
+        return
 
-def check_download_status() -> Tuple[str, str, bool]:
-    """Check if download is complete and return status."""
-    if DOWNLOAD_STATE['result'] and DOWNLOAD_STATE['result'].get('completed'):
-        result_data = DOWNLOAD_STATE['result'].get('result', {})
+    if STATE.in_progress:
+        yield "⚠️ Download already in progress", "", get_stats(), gr.Timer(active=True)
+        return
 
-        status = ""
-        if result_data:
-            if result_data.get('success'):
-                status = result_data['success']
-            if result_data.get('error'):
-                status = result_data['error']
+    initialize_downloader()
 
-        if DOWNLOAD_STATE['result'].get('error'):
-            status = f"❌ Thread error: {DOWNLOAD_STATE['result']['error']}"
+    coro = _download_single_async(url, STATE.downloader)
+    async for update in _run_download_stream(coro):
+        yield update
 
-        DOWNLOAD_STATE['in_progress'] = False
-        DOWNLOAD_STATE['result'] = None
 
-        # Get final logs
-        logs = get_logs_text()
-        return status, logs, False
+async def start_download_category(category_url: Optional[str] = None):
+    """Start downloading a category, streaming progress to the UI."""
+    if STATE.in_progress:
+        yield "⚠️ Download already in progress", "", get_stats(), gr.Timer(active=True)
+        return
 
-    if DOWNLOAD_STATE['in_progress']:
-        logs = get_logs_text()
-        return "⏳ Download in progress...", logs, True
+    initialize_downloader()
 
-    return "", "", False
+    coro = _download_category_async(category_url if category_url else None, STATE.downloader)
+    async for update in _run_download_stream(coro):
+        yield update
 
 
 def get_file_list(search_query: str = "") -> List[Dict]:
@@ -352,15 +488,16 @@ def get_file_list(search_query: str = "") -> List[Dict]:
     files = get_downloaded_files()
 
     if search_query:
-        files = [f for f in files if search_query.lower() in f.stem.lower()]
+        query = search_query.lower()
+        files = [f for f in files if query in f.stem_lower]
 
     file_list = []
     for f in files:
         file_list.append({
-            'path': str(f),
+            'path': str(f.path),
             'name': f.stem,
-            'size': format_file_size(f.stat().st_size),
-            'modified': format_datetime(f.stat().st_mtime)
+            'size': format_file_size(f.size),
+            'modified': format_datetime(f.mtime)
         })
 
     return file_list
@@ -369,11 +506,10 @@ def get_file_list(search_query: str = "") -> List[Dict]:
 def get_stats() -> str:
     """Get statistics for sidebar."""
     try:
-        config_file = get_config_path()
-        config = Config.from_file(config_file)
+        config = get_config()
 
         files = get_downloaded_files()
-        total_size = sum(f.stat().st_size for f in files)
+        total_size = sum(f.size for f in files)
 
         stats = f"""
 ### 📊 Statistics
@@ -390,8 +526,8 @@ def get_stats() -> str:
 """
 
         # Add download stats if available
-        if DOWNLOAD_STATE['downloader'] and DOWNLOAD_STATE['downloader'].stats:
-            dl_stats = DOWNLOAD_STATE['downloader'].stats
+        if STATE.downloader and STATE.downloader.stats:
+            dl_stats = STATE.downloader.stats
             stats += f"""
 ### 📥 Download Stats
 
@@ -443,13 +579,27 @@ def create_bulk_zip(selected_files: List) -> Optional[str]:
         return None
 
     file_paths = [Path(f) for f in selected_files]
-    zip_data = create_zip_of_files(file_paths)
 
-    # Save to temp file
-    temp_zip = Path(f"temp_ohdio_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip")
-    temp_zip.write_bytes(zip_data)
+    # Build in the OS temp dir (often tmpfs) rather than polluting the CWD
+    temp_zip = tempfile.NamedTemporaryFile(delete=False, suffix='.zip', prefix='ohdio_')
+    temp_zip.close()
+    create_zip_of_files(file_paths, Path(temp_zip.name))
+
+    return temp_zip.name
+
+
+def _cleanup_stale_zips() -> None:
+    """Remove bulk-download ZIPs older than an hour from the temp dir."""
+    cutoff = time.time() - 3600
+    for stale in Path(tempfile.gettempdir()).glob("ohdio_*.zip"):
+        try:
+            if stale.stat().st_mtime < cutoff:
+                stale.unlink()
+        except OSError:
+            pass
 
-    return str(temp_zip)
+
+atexit.register(_cleanup_stale_zips)
 
 
 # Initialize downloader on startup
@@ -461,7 +611,6 @@ with gr.Blocks(title="OHdio Audiobook Downloader", theme=gr.themes.Soft()) as ap
     gr.Markdown("# 🎧 OHdio Audiobook Downloader")
 
     # Detect if running on HF Spaces
-    import os
     if os.getenv("SPACE_ID"):
         gr.Markdown("""
         ⚠️ **Geo-Restriction Notice**: Radio-Canada content is geo-restricted to Canada.
@@ -624,16 +773,24 @@ and Radio-Canada's terms of service. Only download content you have the right to
         outputs=[single_mode, category_mode]
     )
 
+    # Stats refresh timer: inactive while idle, activated only during downloads
+    timer = gr.Timer(value=1.0, active=False)
+
+    timer.tick(
+        get_stats,
+        outputs=[stats_display]
+    )
+
     single_btn.click(
         start_download_single,
         inputs=[url_input],
-        outputs=[status_output]
+        outputs=[status_output, logs_output, stats_display, timer]
     )
 
     category_btn.click(
         start_download_category,
         inputs=[category_input],
-        outputs=[status_output]
+        outputs=[status_output, logs_output, stats_display, timer]
     )
 
     clear_logs_btn.click(
@@ -646,7 +803,8 @@ and Radio-Canada's terms of service. Only download content you have the right to
         files = get_downloaded_files()
 
         if search:
-            files = [f for f in files if search.lower() in f.stem.lower()]
+            query = search.lower()
+            files = [f for f in files if query in f.stem_lower]
 
         if not files:
             search_msg = f'matching "{search}"' if search else ''
@@ -656,7 +814,7 @@ and Radio-Canada's terms of service. Only download content you have the right to
             )
 
         file_count = f"**Showing {len(files)} audiobook(s)**"
-        file_choices = [(f"{f.stem} ({format_file_size(f.stat().st_size)})", str(f)) for f in files]
+        file_choices = [(f"{f.stem} ({format_file_size(f.size)})", str(f.path)) for f in files]
 
         return file_count, gr.update(choices=file_choices, value=None)
 
@@ -704,7 +862,7 @@ and Radio-Canada's terms of service. Only download content you have the right to
         # Refresh file list after deletion
         files = get_downloaded_files()
         file_count = f"**Showing {len(files)} audiobook(s)**"
-        file_choices = [(f"{f.stem} ({format_file_size(f.stat().st_size)})", str(f)) for f in files]
+        file_choices = [(f"{f.stem} ({format_file_size(f.size)})", str(f.path)) for f in files]
 
         return (
             result,
@@ -719,7 +877,7 @@ and Radio-Canada's terms of service. Only download content you have the right to
         if not files:
             return None, "⚠️ No files to download"
 
-        zip_path = create_bulk_zip([str(f) for f in files])
+        zip_path = create_bulk_zip([str(f.path) for f in files])
         if zip_path:
             return zip_path, f"✅ Created ZIP with {len(files)} file(s)"
         return None, "❌ Failed to create ZIP"
@@ -730,20 +888,25 @@ and Radio-Canada's terms of service. Only download content you have the right to
         if not files:
             return "⚠️ No files to delete", "**No files found**", gr.update(choices=[])
 
-        result = bulk_delete_files([str(f) for f in files])
+        result = bulk_delete_files([str(f.path) for f in files])
 
-        # Refresh list
+        # Invalidate the scan cache once, then rebuild the count and the
+        # dropdown choices from a single directory pass
+        _FILES_CACHE['key'] = None
         files = get_downloaded_files()
         file_count = f"**Showing {len(files)} audiobook(s)**" if files else "**No files found**"
-        file_choices = [(f"{f.stem} ({format_file_size(f.stat().st_size)})", str(f)) for f in files]
+        file_choices = [(f"{f.stem} ({format_file_size(f.size)})", str(f.path)) for f in files]
 
         return result, file_count, gr.update(choices=file_choices, value=None)
 
     # Wire up file browser events
+    # Last-writer-wins: drop intermediate keystroke events while one is running
     search_input.change(
         update_file_list,
         inputs=[search_input],
-        outputs=[file_count_display, file_dropdown]
+        outputs=[file_count_display, file_dropdown],
+        trigger_mode="always_last",
+        show_progress="hidden"
     )
 
     refresh_btn.click(
@@ -774,28 +937,6 @@ and Radio-Canada's terms of service. Only download content you have the right to
         outputs=[file_action_status, file_count_display, file_dropdown]
     )
 
-    # Auto-update logs and stats during download
-    def poll_download_status(current_logs_value):
-        """Poll download status and update UI."""
-        status, logs, in_progress = check_download_status()
-        stats = get_stats()
-
-        # Append new logs instead of replacing
-        if logs:
-            current_logs = current_logs_value or ""
-            new_logs = current_logs + "\n" + logs if current_logs else logs
-            return new_logs, status, stats
-        return current_logs_value or "", status, stats
-
-    # Create a timer that polls for logs every second
-    timer = gr.Timer(value=1.0, active=True)
-
-    timer.tick(
-        poll_download_status,
-        inputs=[logs_output],
-        outputs=[logs_output, status_output, stats_display]
-    )
-
     # Initialize file browser on load
     app.load(
         update_file_list,
@@ -0,0 +1,16 @@
+"""Shared pytest fixtures for the OHdio downloader test scripts."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the src package importable when pytest is launched from another cwd
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Default Config instance shared across the test session."""
+    from src.utils.config import Config
+    return Config()
@@ -1,18 +1,25 @@
 """Metadata manager for embedding metadata and artwork into audio files."""
 
+import hashlib
 import logging
+import re
 from pathlib import Path
 from typing import Optional
 
-from mutagen.id3 import ID3, APIC, TIT2, TPE1, TALB, TDRC, TCON, TPE3, TPOS, TRCK
+from mutagen.id3 import (
+    APIC, ID3, ID3NoHeaderError, TIT2, TPE1, TALB, TDRC, TCON, TPE3, TPOS, TRCK
+)
 from mutagen.mp3 import MP3
-from mutagen.id3._util import ID3NoHeaderError
 from PIL import Image
 import io
 
 from ..scraper.audiobook_scraper import AudiobookMetadata
 
 
+# Four-digit year anywhere in a date string, compiled once at import
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+
 class MetadataManager:
     """Manages metadata embedding for audio files."""
     
@@ -24,17 +31,22 @@ class MetadataManager:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # Processed cover art keyed by content digest: books in a series
+        # often share one cover, so it is decoded and re-encoded once
+        self._image_cache = {}
     
     def embed_metadata(
         self, 
         audio_file_path: str, 
-        metadata: AudiobookMetadata
+        metadata: AudiobookMetadata,
+        force: bool = False
     ) -> bool:
         """Embed metadata into an audio file.
         
         Args:
             audio_file_path: Path to the audio file
             metadata: AudiobookMetadata object
+            force: Drop all existing frames instead of updating in place
             
         Returns:
             True if successful, False otherwise
@@ -51,31 +63,44 @@ class MetadataManager:
             
             self.logger.info(f"Embedding metadata for: {audio_path.name}")
             
-            # Load the MP3 file
+            # Load the MP3 file; the constructor already parses any ID3
+            # block, so re-reading it with ID3(path) would repeat the file
+            # open and header scan for nothing
             audio = MP3(str(audio_path))
             
             # Create ID3 tag if it doesn't exist
-            try:
-                audio.tags = ID3(str(audio_path))
-            except ID3NoHeaderError:
+            if audio.tags is None:
                 audio.add_tags()
-                audio.tags = audio.tags
             
-            # Clear existing tags
-            audio.tags.clear()
-            
-            # Add basic metadata
-            self._add_basic_tags(audio.tags, metadata)
+            # Idempotent re-runs are the common case when rescraping: a
+            # private hash frame records what was last written, so files
+            # whose metadata has not changed skip the tag rebuild and the
+            # save entirely
+            content_hash = self._metadata_hash(metadata)
+            if not force:
+                existing = audio.tags.getall('TXXX:OHDIO_HASH')
+                if existing and existing[0].text and existing[0].text[0] == content_hash:
+                    self.logger.debug(f"Metadata unchanged, skipping: {audio_path.name}")
+                    return True
+            
+            # Update frames in place: ID3.add replaces by frame key, so
+            # re-tagging overwrites what changed and leaves the rest.
+            # Clearing forces mutagen to rebuild the whole block and, once
+            # it outgrows the padding, shift the entire audio stream
+            if force:
+                audio.tags.clear()
             
-            # Add extended metadata
-            self._add_extended_tags(audio.tags, metadata)
+            # Build every frame first, then install them in one pass
+            for frame in self._build_frames(metadata, content_hash):
+                audio.tags.add(frame)
             
             # Add artwork if available
             if metadata.thumbnail_data:
                 self._add_artwork(audio.tags, metadata.thumbnail_data)
             
-            # Save the changes
-            audio.save()
+            # Save the changes, keeping at least 1 KiB of padding so
+            # future updates fit without rewriting the audio stream
+            audio.save(v2_version=3, padding=lambda info: max(1024, info.padding))
             self.logger.info(f"Successfully embedded metadata for: {audio_path.name}")
             return True
             
@@ -83,48 +108,102 @@ class MetadataManager:
             self.logger.error(f"Failed to embed metadata for {audio_file_path}: {e}")
             return False
     
-    def _add_basic_tags(self, tags, metadata: AudiobookMetadata) -> None:
-        """Add basic ID3 tags.
+    def _build_frames(self, metadata: AudiobookMetadata, content_hash: str) -> list:
+        """Build the complete ID3 frame list for an audiobook.
+        
+        Collecting the frames up front keeps frame construction separate
+        from tag mutation, so embed_metadata installs them in one pass.
+        
+        Args:
+            metadata: AudiobookMetadata object
+            content_hash: Hash recorded in the OHDIO_HASH frame
+            
+        Returns:
+            List of mutagen frames ready to install
+        """
+        frames = []
+        self._add_basic_tags(frames, metadata)
+        self._add_extended_tags(frames, metadata, content_hash)
+        return frames
+    
+    def _metadata_hash(self, metadata: AudiobookMetadata) -> str:
+        """Compute a stable digest of the fields embed_metadata writes.
         
         Args:
-            tags: ID3 tags object
+            metadata: AudiobookMetadata object
+            
+        Returns:
+            Hex digest identifying this metadata revision
+        """
+        cover_digest = ''
+        if metadata.thumbnail_data:
+            cover_digest = hashlib.blake2b(
+                metadata.thumbnail_data, digest_size=16
+            ).hexdigest()
+        
+        fields = '|'.join((
+            metadata.title or '',
+            metadata.author or '',
+            metadata.narrator or '',
+            metadata.series or '',
+            str(metadata.series_number or ''),
+            metadata.publication_date or '',
+            metadata.genre or '',
+            metadata.publisher or '',
+            metadata.isbn or '',
+            metadata.duration or '',
+            metadata.url or '',
+            metadata.language or '',
+            metadata.description or '',
+            cover_digest,
+        ))
+        return hashlib.blake2b(fields.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _add_basic_tags(self, frames: list, metadata: AudiobookMetadata) -> None:
+        """Append basic ID3 frames.
+        
+        Args:
+            frames: List collecting the built frames
             metadata: AudiobookMetadata object
         """
         # Title
         if metadata.title:
-            tags.add(TIT2(encoding=3, text=[metadata.title]))
+            frames.append(TIT2(encoding=3, text=[metadata.title]))
         
         # Artist (Author)
         if metadata.author:
-            tags.add(TPE1(encoding=3, text=[metadata.author]))
+            frames.append(TPE1(encoding=3, text=[metadata.author]))
         
         # Album (also use title for audiobooks)
         album_name = metadata.title or "Unknown Audiobook"
-        tags.add(TALB(encoding=3, text=[album_name]))
+        frames.append(TALB(encoding=3, text=[album_name]))
         
         # Date/Year
         if metadata.publication_date:
             # Try to extract year from date
             year = self._extract_year(metadata.publication_date)
             if year:
-                tags.add(TDRC(encoding=3, text=[str(year)]))
+                frames.append(TDRC(encoding=3, text=[str(year)]))
         
         # Genre
         if metadata.genre:
-            tags.add(TCON(encoding=3, text=[metadata.genre]))
+            frames.append(TCON(encoding=3, text=[metadata.genre]))
         else:
-            tags.add(TCON(encoding=3, text=["Audiobook"]))
+            frames.append(TCON(encoding=3, text=["Audiobook"]))
     
-    def _add_extended_tags(self, tags, metadata: AudiobookMetadata) -> None:
-        """Add extended ID3 tags.
+    def _add_extended_tags(
+        self, frames: list, metadata: AudiobookMetadata, content_hash: str
+    ) -> None:
+        """Append extended ID3 frames.
         
         Args:
-            tags: ID3 tags object
+            frames: List collecting the built frames
             metadata: AudiobookMetadata object
+            content_hash: Hash recorded in the OHDIO_HASH frame
         """
         # Narrator (using TPE3 - Conductor/Performer)
         if metadata.narrator:
-            tags.add(TPE3(encoding=3, text=[metadata.narrator]))
+            frames.append(TPE3(encoding=3, text=[metadata.narrator]))
         
         # Series information
         if metadata.series:
@@ -133,48 +212,55 @@ class MetadataManager:
                 series_text = f"{metadata.series} #{metadata.series_number}"
             else:
                 series_text = metadata.series
-            tags.add(TPOS(encoding=3, text=[series_text]))
+            frames.append(TPOS(encoding=3, text=[series_text]))
         
         # Track number (set to 1 for audiobooks)
-        tags.add(TRCK(encoding=3, text=["1/1"]))
+        frames.append(TRCK(encoding=3, text=["1/1"]))
         
-        # Add custom tags for additional metadata
-        self._add_custom_tags(tags, metadata)
+        # Add custom frames for additional metadata
+        self._add_custom_tags(frames, metadata, content_hash)
     
-    def _add_custom_tags(self, tags, metadata: AudiobookMetadata) -> None:
-        """Add custom tags for audiobook-specific metadata.
+    def _add_custom_tags(
+        self, frames: list, metadata: AudiobookMetadata, content_hash: str
+    ) -> None:
+        """Append custom frames for audiobook-specific metadata.
         
         Args:
-            tags: ID3 tags object
+            frames: List collecting the built frames
             metadata: AudiobookMetadata object
+            content_hash: Hash recorded in the OHDIO_HASH frame
         """
         from mutagen.id3 import TXXX, COMM
         
         # Publisher
         if metadata.publisher:
-            tags.add(TXXX(encoding=3, desc="PUBLISHER", text=[metadata.publisher]))
+            frames.append(TXXX(encoding=3, desc="PUBLISHER", text=[metadata.publisher]))
         
         # ISBN
         if metadata.isbn:
-            tags.add(TXXX(encoding=3, desc="ISBN", text=[metadata.isbn]))
+            frames.append(TXXX(encoding=3, desc="ISBN", text=[metadata.isbn]))
         
         # Duration
         if metadata.duration:
-            tags.add(TXXX(encoding=3, desc="DURATION", text=[metadata.duration]))
+            frames.append(TXXX(encoding=3, desc="DURATION", text=[metadata.duration]))
         
         # Source URL
         if metadata.url:
-            tags.add(TXXX(encoding=3, desc="SOURCE_URL", text=[metadata.url]))
+            frames.append(TXXX(encoding=3, desc="SOURCE_URL", text=[metadata.url]))
         
         # Language
         if metadata.language:
-            tags.add(TXXX(encoding=3, desc="LANGUAGE", text=[metadata.language]))
+            frames.append(TXXX(encoding=3, desc="LANGUAGE", text=[metadata.language]))
         
-        # Description/Summary as comment
+        # Description/Summary as comment, truncated if too long (a slice
+        # past the end is a no-op, so no length check is needed)
         if metadata.description:
-            # Truncate if too long
-            description = metadata.description[:1000] if len(metadata.description) > 1000 else metadata.description
-            tags.add(COMM(encoding=3, lang="fra", desc="Description", text=[description]))
+            description = metadata.description[:1000]
+            frames.append(COMM(encoding=3, lang="fra", desc="Description", text=[description]))
+        
+        # Revision marker consulted by embed_metadata to skip unchanged
+        # files on re-runs
+        frames.append(TXXX(encoding=3, desc="OHDIO_HASH", text=[content_hash]))
     
     def _add_artwork(self, tags, image_data: bytes) -> None:
         """Add artwork to ID3 tags.
@@ -184,8 +270,15 @@ class MetadataManager:
             image_data: Raw image data
         """
         try:
-            # Process the image
-            processed_image = self._process_image(image_data)
+            # Process the image, reusing the cached result for covers
+            # already seen this run (blake2b is far cheaper than the
+            # decode/resize/encode pipeline it guards)
+            digest = hashlib.blake2b(image_data, digest_size=16).digest()
+            processed_image = self._image_cache.get(digest)
+            if processed_image is None:
+                processed_image = self._process_image(image_data)
+                if processed_image and len(self._image_cache) < 128:
+                    self._image_cache[digest] = processed_image
             
             if processed_image:
                 # Add as cover art (front cover)
@@ -213,22 +306,72 @@ class MetadataManager:
             Processed image data or None if failed
         """
         try:
-            # Open image with PIL
-            image = Image.open(io.BytesIO(image_data))
+            # Players render APIC art well below 300px, so anything larger
+            # only costs resample pixels and embedded bytes; the cap is
+            # configurable for users who want bigger covers
+            max_size = (self.config.cover_max_size, self.config.cover_max_size)
+            
+            # One buffer serves both the header probe and the decode;
+            # BytesIO shares the bytes object until first write, so this
+            # avoids materializing a second copy of multi-megabyte covers
+            buffer = io.BytesIO(image_data)
+            
+            # Fast path: opening only parses the header, so a source JPEG
+            # already within the cap skips the whole decode/resize/encode
+            # round-trip and is embedded as-is
+            with Image.open(buffer) as probe:
+                fmt, size = probe.format, probe.size
+            if (
+                fmt == 'JPEG'
+                and size[0] <= max_size[0]
+                and size[1] <= max_size[1]
+                and len(image_data) < 200_000
+            ):
+                self.logger.debug(f"Keeping source JPEG as-is: {size[0]}x{size[1]}, {len(image_data)} bytes")
+                return image_data
+            
+            # Open image with PIL, rewinding the probe buffer
+            buffer.seek(0)
+            image = Image.open(buffer)
+            
+            # Ask the decoder for DCT-domain downscaling. The probe above
+            # already yielded the source dimensions, so the DCT scale
+            # (1, 1/2, 1/4 or 1/8) is computed explicitly and the exact
+            # decoded size requested: libjpeg then skips IDCT work for
+            # the dropped blocks and the resample pass below usually
+            # becomes a no-op
+            if fmt == 'JPEG':
+                fitting = [
+                    s for s in (1, 2, 4, 8)
+                    if size[0] <= max_size[0] * s and size[1] <= max_size[1] * s
+                ]
+                scale = fitting[0] if fitting else 8
+                image.draft('RGB', (size[0] // scale, size[1] // scale))
             
             # Convert to RGB if necessary
             if image.mode in ('RGBA', 'P'):
                 image = image.convert('RGB')
             
-            # Resize if too large (max 500x500 for audiobooks)
-            max_size = (500, 500)
+            # Resize if too large; after draft the input is within 2x of
+            # the target, where HAMMING matches LANCZOS visually at a
+            # fraction of the cost
             if image.size[0] > max_size[0] or image.size[1] > max_size[1]:
-                image.thumbnail(max_size, Image.Resampling.LANCZOS)
+                image.thumbnail(max_size, Image.Resampling.HAMMING)
                 self.logger.debug(f"Resized image to {image.size}")
             
-            # Save as JPEG with good quality
+            # Save as JPEG: progressive scans with optimized Huffman
+            # tables shrink the embedded payload 20-40% at equivalent
+            # quality, and quality 80 is visually indistinguishable for
+            # art that players render well below 1:1
             output = io.BytesIO()
-            image.save(output, format='JPEG', quality=85, optimize=True)
+            image.save(
+                output,
+                format='JPEG',
+                quality=80,
+                optimize=True,
+                progressive=True,
+                subsampling='4:2:0',
+            )
             
             processed_data = output.getvalue()
             self.logger.debug(f"Processed image: {len(processed_data)} bytes")
@@ -248,44 +391,49 @@ class MetadataManager:
         Returns:
             Year as integer or None
         """
-        import re
-        
-        # Try to find a 4-digit year
-        year_match = re.search(r'\b(19|20)\d{2}\b', date_string)
-        if year_match:
-            try:
-                return int(year_match.group())
-            except ValueError:
-                pass
-        
-        return None
+        year_match = _YEAR_RE.search(date_string)
+        return int(year_match.group()) if year_match else None
     
-    def verify_metadata(self, audio_file_path: str) -> dict:
+    def verify_metadata(self, audio_file_path: str, full: bool = False) -> dict:
         """Verify metadata in an audio file.
         
         Args:
             audio_file_path: Path to the audio file
+            full: Also parse the MPEG stream for duration and bitrate
             
         Returns:
             Dictionary with metadata information
         """
         try:
-            audio = MP3(audio_file_path)
-            
-            if not audio.tags:
+            if full:
+                audio = MP3(audio_file_path)
+                tags = audio.tags
+                info = audio.info
+            else:
+                # ID3 alone reads just the tag block at the head of the
+                # file; MP3 would additionally walk the MPEG frames to
+                # compute length and bitrate, which library listings
+                # never look at
+                try:
+                    tags = ID3(audio_file_path)
+                except ID3NoHeaderError:
+                    tags = None
+                info = None
+            
+            if not tags:
                 return {"status": "no_tags"}
             
             metadata_info = {
                 "status": "success",
-                "title": self._get_tag_value(audio.tags, TIT2),
-                "artist": self._get_tag_value(audio.tags, TPE1),
-                "album": self._get_tag_value(audio.tags, TALB),
-                "date": self._get_tag_value(audio.tags, TDRC),
-                "genre": self._get_tag_value(audio.tags, TCON),
-                "narrator": self._get_tag_value(audio.tags, TPE3),
-                "has_artwork": any(isinstance(tag, APIC) for tag in audio.tags.values()),
-                "duration": audio.info.length if audio.info else None,
-                "bitrate": audio.info.bitrate if audio.info else None,
+                "title": self._get_tag_value(tags, TIT2),
+                "artist": self._get_tag_value(tags, TPE1),
+                "album": self._get_tag_value(tags, TALB),
+                "date": self._get_tag_value(tags, TDRC),
+                "genre": self._get_tag_value(tags, TCON),
+                "narrator": self._get_tag_value(tags, TPE3),
+                "has_artwork": bool(tags.getall('APIC')),
+                "duration": info.length if info else None,
+                "bitrate": info.bitrate if info else None,
             }
             
             return metadata_info
@@ -304,12 +452,11 @@ class MetadataManager:
         Returns:
             Tag value or None
         """
-        try:
-            for tag in tags.values():
-                if isinstance(tag, tag_class):
-                    return str(tag.text[0]) if tag.text else None
-        except (IndexError, AttributeError):
-            pass
+        # Frames are indexed by their ID, so this is a dict lookup rather
+        # than an isinstance scan over every frame in the tag
+        frame = tags.get(tag_class.__name__)
+        if frame is not None and getattr(frame, 'text', None):
+            return str(frame.text[0])
         return None
     
     def remove_metadata(self, audio_file_path: str) -> bool:
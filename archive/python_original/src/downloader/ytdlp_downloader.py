@@ -1,10 +1,13 @@
 """yt-dlp based downloader for audiobook playlists."""
 
 import asyncio
+import concurrent.futures
+import copy
+import functools
 import logging
 import os
-import subprocess
-import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable
 
@@ -13,9 +16,45 @@ import yt_dlp
 from ..utils.file_utils import sanitize_filename, get_safe_path, ensure_directory_exists
 
 
+# How long cached media-info probes stay valid, and how many are kept.
+# Each raw info dict carries the full formats list, so the cache is
+# bounded like an LRU instead of growing with every URL ever probed
+_INFO_CACHE_TTL = 300.0
+_INFO_CACHE_MAX = 32
+
+# Files at or below this size are leftovers from crashed runs, not
+# audiobooks; re-download them instead of skipping
+_MIN_EXISTING_BYTES = 1024
+
+
+def _existing_size(path) -> int:
+    """Return the file size in bytes, or -1 if the path does not exist.
+    
+    One stat yields both existence and size, where Path.exists followed
+    by a size check would cost two syscalls.
+    
+    Args:
+        path: Filesystem path to probe
+        
+    Returns:
+        Size in bytes, or -1 when the path is missing
+    """
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return -1
+
+
 class YtDlpDownloader:
     """Downloads audiobook playlists using yt-dlp."""
     
+    # Speed-unit ladder: (threshold, label, divisor), largest first
+    _UNITS = (
+        (1 << 20, 'MB/s', 1 << 20),
+        (1 << 10, 'KB/s', 1 << 10),
+        (0, 'B/s', 1),
+    )
+    
     def __init__(self, config):
         """Initialize the downloader.
         
@@ -24,6 +63,28 @@ class YtDlpDownloader:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # Dedicated pool for yt-dlp work: the loop's default executor is
+        # shared with other blocking calls, so a private pool keeps
+        # downloads and those from starving each other, and its size caps
+        # how many yt-dlp instances run at once
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=config.max_concurrent_downloads,
+            thread_name_prefix='ytdlp'
+        )
+        # Media-info probes are network and parse heavy and the same URL
+        # is probed by several test modes; cache results briefly, with a
+        # lock since callers may come from worker threads
+        self._info_cache: Dict[str, Any] = {}
+        self._info_cache_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Shut down the dedicated executor's worker threads.
+        
+        Call when the downloader is no longer needed; otherwise the idle
+        threads linger for the life of the process, which adds up when
+        downloaders are constructed per request.
+        """
+        self._executor.shutdown(wait=False)
     
     async def download_audiobook(
         self,
@@ -57,8 +118,9 @@ class YtDlpDownloader:
         filename = self._generate_filename(title, author)
         output_path = get_safe_path(output_dir, filename)
         
-        # Check if file already exists and skip if configured
-        if self.config.skip_existing and output_path.exists():
+        # Check if file already exists and skip if configured; the size
+        # probe doubles as a guard against truncated leftovers
+        if self.config.skip_existing and _existing_size(output_path) > _MIN_EXISTING_BYTES:
             self.logger.info(f"File already exists, skipping: {output_path}")
             return str(output_path)
         
@@ -72,7 +134,7 @@ class YtDlpDownloader:
                 progress_callback
             )
             
-            if success and output_path.exists():
+            if success and _existing_size(output_path) > 0:
                 self.logger.info(f"Successfully downloaded: {output_path}")
                 return str(output_path)
             else:
@@ -83,6 +145,27 @@ class YtDlpDownloader:
             self.logger.error(f"Error downloading {playlist_url}: {e}")
             return None
     
+    async def download_many(self, jobs: list) -> list:
+        """Download several audiobooks concurrently.
+        
+        Fragment-level concurrency inside yt-dlp multiplies with this
+        inter-book concurrency; the semaphore matches the executor size so
+        queued jobs wait in the event loop instead of piling onto threads.
+        
+        Args:
+            jobs: List of keyword-argument dicts for download_audiobook
+            
+        Returns:
+            List of download_audiobook results in job order
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_downloads)
+        
+        async def bounded(job):
+            async with semaphore:
+                return await self.download_audiobook(**job)
+        
+        return await asyncio.gather(*(bounded(job) for job in jobs))
+    
     async def _download_with_ytdlp(
         self,
         url: str,
@@ -99,14 +182,20 @@ class YtDlpDownloader:
         Returns:
             True if successful, False otherwise
         """
+        # Probe the source codec so options can skip the re-encode for
+        # MP3-in-HLS streams; the probe result is cached and reused to
+        # seed the download itself, so the page is extracted only once
+        info = await self._get_info(url)
+        source_codec = info.get('acodec') if info else None
+        
         # Prepare yt-dlp options
-        ydl_opts = self._get_ytdlp_options(output_path, progress_callback)
+        ydl_opts = self._get_ytdlp_options(output_path, progress_callback, source_codec)
         
         try:
-            # Run yt-dlp in executor to avoid blocking
+            # Run yt-dlp in the dedicated executor to avoid blocking
             loop = asyncio.get_event_loop()
             success = await loop.run_in_executor(
-                None, 
+                self._executor, 
                 self._run_ytdlp, 
                 url, 
                 ydl_opts
@@ -127,9 +216,18 @@ class YtDlpDownloader:
         Returns:
             True if successful, False otherwise
         """
+        # A warm info cache lets the download skip its own extraction
+        # pass; the copy keeps processing from mutating the cached entry
+        with self._info_cache_lock:
+            cached = self._info_cache.get(url)
+            info = copy.deepcopy(cached[1]) if cached is not None else None
+        
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+                if info is not None:
+                    ydl.process_ie_result(info, download=True)
+                else:
+                    ydl.download([url])
             return True
         except Exception as e:
             self.logger.error(f"yt-dlp download error: {e}")
@@ -138,13 +236,15 @@ class YtDlpDownloader:
     def _get_ytdlp_options(
         self, 
         output_path: Path, 
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        source_codec: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get yt-dlp configuration options.
         
         Args:
             output_path: Output file path
             progress_callback: Progress callback function
+            source_codec: Audio codec reported by the media-info probe
             
         Returns:
             Dictionary of yt-dlp options
@@ -169,20 +269,36 @@ class YtDlpDownloader:
             'retries': self.config.retry_attempts,
             'fragment_retries': self.config.retry_attempts,
             'http_headers': self.config.get_headers(),
+            # Larger chunks mean fewer HTTP round-trips per segment
+            'downloader_options': {'http_chunk_size': 10 * 1024 * 1024},
         }
         
-        # Add progress hook if callback provided
+        # Add progress hook if callback provided. The throttle window
+        # lives in the closure so concurrent downloads through the same
+        # downloader do not reset each other's timestamps
         if progress_callback:
+            last_cb = [0.0]
             ydl_opts['progress_hooks'] = [
-                lambda d: self._progress_hook(d, progress_callback)
+                lambda d: self._progress_hook(d, progress_callback, last_cb)
             ]
         
-        # Post-processing to convert to MP3
-        ydl_opts['postprocessors'] = [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'mp3',
-            'preferredquality': self._get_audio_quality(),
-        }]
+        # Post-processing: when the HLS stream already carries MP3 audio,
+        # a container remux copies the stream bit-for-bit instead of
+        # decoding and re-encoding it through libmp3lame, and the native
+        # HLS downloader concatenates segments without shelling out to
+        # ffmpeg for the download itself
+        if source_codec == 'mp3':
+            ydl_opts['hls_prefer_native'] = True
+            ydl_opts['postprocessors'] = [{
+                'key': 'FFmpegVideoRemuxer',
+                'preferedformat': 'mp3',
+            }]
+        else:
+            ydl_opts['postprocessors'] = [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'mp3',
+                'preferredquality': self._get_audio_quality(),
+            }]
         
         return ydl_opts
     
@@ -228,15 +344,28 @@ class YtDlpDownloader:
         except ValueError:
             return "0"  # Default to best quality
     
-    def _progress_hook(self, d: Dict[str, Any], callback: Callable) -> None:
+    def _progress_hook(
+        self, d: Dict[str, Any], callback: Callable, last_cb: list
+    ) -> None:
         """Progress hook for yt-dlp.
         
         Args:
             d: Progress data from yt-dlp
             callback: Progress callback function
+            last_cb: Single-element list holding this download's last
+                callback timestamp
         """
         try:
             if d['status'] == 'downloading':
+                # yt-dlp fires this per fragment — hundreds of times a
+                # second for HLS — and downstream consumers only act on
+                # 5% steps, so drop callbacks inside a 0.25s window
+                # before doing any formatting work
+                now = time.monotonic()
+                if now - last_cb[0] < 0.25:
+                    return
+                last_cb[0] = now
+                
                 # Extract progress information
                 total_bytes = d.get('total_bytes') or d.get('total_bytes_estimate')
                 downloaded_bytes = d.get('downloaded_bytes', 0)
@@ -246,16 +375,13 @@ class YtDlpDownloader:
                 if total_bytes and downloaded_bytes:
                     progress_percent = (downloaded_bytes / total_bytes) * 100
                     
-                    # Format speed
+                    # Format speed against the precomputed unit ladder
+                    speed_str = "unknown"
                     if speed:
-                        if speed > 1024 * 1024:
-                            speed_str = f"{speed / (1024 * 1024):.1f} MB/s"
-                        elif speed > 1024:
-                            speed_str = f"{speed / 1024:.1f} KB/s"
-                        else:
-                            speed_str = f"{speed:.0f} B/s"
-                    else:
-                        speed_str = "unknown"
+                        for threshold, label, divisor in self._UNITS:
+                            if speed >= threshold:
+                                speed_str = f"{speed / divisor:.1f} {label}"
+                                break
                     
                     # Call the callback
                     callback(progress_percent, speed_str, eta)
@@ -264,9 +390,15 @@ class YtDlpDownloader:
         except Exception as e:
             self.logger.debug(f"Progress hook error: {e}")
     
-    def _generate_filename(self, title: str, author: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _generate_filename(title: str, author: str) -> str:
         """Generate a safe filename for the audiobook.
         
+        Sanitization walks the title and author character by character;
+        the orchestrator asks for the same name during its skip check and
+        again at download time, so the result is memoized by input.
+        
         Args:
             title: Book title
             author: Book author
@@ -286,44 +418,74 @@ class YtDlpDownloader:
         Returns:
             True if URL is accessible, False otherwise
         """
+        return await self._get_info(url) is not None
+    
+    def _extract_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """Extract raw media info for a URL, caching by URL.
+        
+        Every caller — accessibility check, media-info summary and the
+        download itself — funnels through this one extraction, so a URL
+        costs a single network-and-parse pass per TTL window.
+        
+        Args:
+            url: URL to extract
+            
+        Returns:
+            Raw yt-dlp info dictionary or None if extraction failed
+        """
+        with self._info_cache_lock:
+            cached = self._info_cache.get(url)
+            if cached is not None and time.monotonic() - cached[0] < _INFO_CACHE_TTL:
+                # Re-insert on hit so eviction drops the least recently
+                # used entry first
+                del self._info_cache[url]
+                self._info_cache[url] = cached
+                self.logger.debug(f"Media info cache hit for {url}")
+                return cached[1]
+        
         try:
-            # Create minimal yt-dlp options for testing
             ydl_opts = {
                 'quiet': True,
                 'no_warnings': True,
-                'extract_flat': True,
                 'http_headers': self.config.get_headers(),
             }
             
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                self._test_url_extraction,
-                url,
-                ydl_opts
-            )
-            return result
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=False)
             
+            if info:
+                # Only successful probes are cached; failures stay
+                # retryable. Inserts also evict anything expired and the
+                # least recently used entries beyond the cap, keeping the
+                # cache bounded on long-lived downloader instances
+                with self._info_cache_lock:
+                    now = time.monotonic()
+                    expired = [
+                        key for key, value in self._info_cache.items()
+                        if now - value[0] >= _INFO_CACHE_TTL
+                    ]
+                    for key in expired:
+                        del self._info_cache[key]
+                    while len(self._info_cache) >= _INFO_CACHE_MAX:
+                        del self._info_cache[next(iter(self._info_cache))]
+                    self._info_cache[url] = (now, info)
+                return info
         except Exception as e:
-            self.logger.debug(f"URL accessibility check failed for {url}: {e}")
-            return False
+            self.logger.debug(f"Failed to extract media info for {url}: {e}")
+        
+        return None
     
-    def _test_url_extraction(self, url: str, ydl_opts: Dict[str, Any]) -> bool:
-        """Test URL extraction with yt-dlp.
+    async def _get_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """Async wrapper around _extract_info using the dedicated executor.
         
         Args:
-            url: URL to test
-            ydl_opts: yt-dlp options
+            url: URL to extract
             
         Returns:
-            True if extraction successful, False otherwise
+            Raw yt-dlp info dictionary or None if extraction failed
         """
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return info is not None
-        except Exception:
-            return False
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, self._extract_info, url)
     
     def get_media_info(self, url: str) -> Optional[Dict[str, Any]]:
         """Get media information from URL without downloading.
@@ -334,30 +496,20 @@ class YtDlpDownloader:
         Returns:
             Dictionary with media info or None if failed
         """
-        try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'http_headers': self.config.get_headers(),
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                if info:
-                    return {
-                        'title': info.get('title'),
-                        'duration': info.get('duration'),
-                        'uploader': info.get('uploader'),
-                        'upload_date': info.get('upload_date'),
-                        'formats': len(info.get('formats', [])),
-                        'filesize': info.get('filesize'),
-                        'format_id': info.get('format_id'),
-                    }
-        except Exception as e:
-            self.logger.debug(f"Failed to get media info for {url}: {e}")
+        info = self._extract_info(url)
+        if not info:
+            return None
         
-        return None
+        return {
+            'title': info.get('title'),
+            'duration': info.get('duration'),
+            'uploader': info.get('uploader'),
+            'upload_date': info.get('upload_date'),
+            'formats': len(info.get('formats', [])),
+            'filesize': info.get('filesize'),
+            'format_id': info.get('format_id'),
+            'acodec': info.get('acodec'),
+        }
 
 
 class DownloadProgress:
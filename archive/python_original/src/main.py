@@ -1,12 +1,17 @@
 """Main application entry point for the OHdio audiobook downloader."""
 
 import asyncio
+import json
 import logging
+import os
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional
 
+from .utils.concurrency import AdmissionController
 from .utils.config import Config
+from .utils.http_client import get_session, close_session
 from .utils.logger import setup_logging, LoggingContext
 from .scraper.category_scraper import CategoryScraper, AudiobookInfo
 from .scraper.audiobook_scraper import AudiobookScraper, AudiobookMetadata
@@ -17,6 +22,12 @@ from .downloader.metadata_manager import MetadataManager
 class OHdioDownloader:
     """Main application class for downloading OHdio audiobooks."""
     
+    # Name of the per-directory index of completed downloads
+    INDEX_FILENAME = ".ohdio_index.json"
+    
+    # Persist the index after this many new downloads
+    INDEX_FLUSH_EVERY = 25
+    
     def __init__(self, config_file: str = "config.json"):
         """Initialize the downloader.
         
@@ -32,6 +43,29 @@ class OHdioDownloader:
         self.downloader = YtDlpDownloader(self.config)
         self.metadata_manager = MetadataManager(self.config)
         
+        # Known downloads come from the persisted index when one exists
+        # (a single file read) with a directory scan as fallback, so the
+        # skip-existing check is a set lookup instead of a stat syscall
+        # per book — dominant on network or bind-mounted volumes
+        self._output_dir = Path(self.config.output_directory)
+        self._index_path = self._output_dir / self.INDEX_FILENAME
+        self._existing_files = self._load_existing_files() if self.config.skip_existing else set()
+        self._unsaved_downloads = 0
+        
+        # Hoist config attributes the per-book coroutines consult: each
+        # use would otherwise walk two attribute chains per book, and the
+        # values never change after startup
+        self._skip_existing = self.config.skip_existing
+        self._embed_metadata = self.config.embed_metadata
+        self._delay = self.config.delay_between_requests
+        
+        # Metadata scrapes are cheap HTTP requests, so the worker pool is
+        # sized by scrape_concurrency; the RAM-hungry yt-dlp download step
+        # is gated separately to max_concurrent_downloads. The controller
+        # can be resized at runtime if the server starts rate-limiting.
+        # Created lazily so it binds to the running event loop
+        self._download_gate: Optional[AdmissionController] = None
+        
         # Statistics
         self.stats = {
             'discovered': 0,
@@ -41,6 +75,64 @@ class OHdioDownloader:
             'skipped': 0
         }
     
+    def _load_existing_files(self) -> set:
+        """Load the set of known, still-present download filenames.
+        
+        Returns:
+            Index entries validated against one directory scan, or the
+            bare scan when the index is missing or unreadable
+        """
+        if not self._output_dir.is_dir():
+            return set()
+        
+        present = {entry.name for entry in os.scandir(self._output_dir)}
+        
+        try:
+            names = json.loads(self._index_path.read_text(encoding='utf-8'))
+            if isinstance(names, list):
+                # A file the user deleted must be re-downloaded even if
+                # indexed, so entries are checked against the directory;
+                # the single scandir is still far cheaper than the
+                # per-book stat calls this replaces
+                return set(names) & present
+        except (OSError, ValueError):
+            pass
+        
+        return present
+    
+    def _save_index(self) -> None:
+        """Atomically persist the known-download index."""
+        try:
+            tmp_path = self._index_path.with_suffix('.json.tmp')
+            tmp_path.write_text(
+                json.dumps(sorted(self._existing_files)), encoding='utf-8'
+            )
+            os.replace(tmp_path, self._index_path)
+            self._unsaved_downloads = 0
+        except OSError as e:
+            self.logger.warning(f"Could not persist download index: {e}")
+    
+    async def __aenter__(self) -> "OHdioDownloader":
+        """Open the shared HTTP session inside the running event loop.
+        
+        Scrapers and the downloader all fetch through the pooled session
+        in http_client, so one TLS handshake and DNS lookup per host
+        covers the whole run; entering here just creates it eagerly so
+        the first page fetch is not also paying session construction.
+        
+        Returns:
+            This downloader instance
+        """
+        await get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Persist the download index and release pooled resources."""
+        if self._unsaved_downloads:
+            self._save_index()
+        self.downloader.close()
+        await close_session()
+    
     async def download_all_audiobooks(self, category_url: Optional[str] = None) -> None:
         """Download all audiobooks from the category page.
         
@@ -50,16 +142,49 @@ class OHdioDownloader:
         self.logger.info("Starting OHdio audiobook download process")
         
         try:
-            # Step 1: Discover audiobooks
-            audiobooks = await self._discover_audiobooks(category_url)
-            if not audiobooks:
+            # Discovery streams straight into the worker queue, so the
+            # first downloads start while later books are still being
+            # parsed: wall-clock is max(discover, process), not their sum
+            queue: asyncio.Queue = asyncio.Queue(
+                maxsize=2 * self.config.scrape_concurrency
+            )
+            # Each worker tallies outcomes into its own Counter; merging
+            # once at the end keeps the hot path free of shared-state
+            # writes (and stays correct if dict increments ever stop
+            # being atomic, as under free-threaded CPython)
+            counters = [
+                Counter() for _ in range(self.config.scrape_concurrency)
+            ]
+            workers = [
+                asyncio.create_task(self._process_worker(queue, counter))
+                for counter in counters
+            ]
+            
+            try:
+                await self._discover_audiobooks(queue, category_url)
+                
+                # Graceful drain: one sentinel per worker, then wait
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers)
+            except BaseException:
+                # Fail-fast teardown with TaskGroup semantics (TaskGroup
+                # itself needs 3.11): a discovery failure or Ctrl-C
+                # cancels the pool instead of orphaning workers that
+                # would keep yt-dlp hammering the server
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+            finally:
+                for counter in counters:
+                    for key, value in counter.items():
+                        self.stats[key] += value
+            
+            if not self.stats['discovered']:
                 self.logger.error("No audiobooks discovered")
                 return
             
-            # Step 2: Process each audiobook
-            await self._process_audiobooks(audiobooks)
-            
-            # Step 3: Print summary
             self._print_summary()
             
         except Exception as e:
@@ -85,7 +210,10 @@ class OHdioDownloader:
                 url=book_url
             )
             
-            success = await self._process_single_audiobook(audiobook_info)
+            outcome = await self._process_single_audiobook(audiobook_info)
+            self.stats['processed'] += 1
+            self.stats[outcome] += 1
+            success = outcome != 'failed'
             
             if success:
                 self.logger.info("Single audiobook download completed successfully")
@@ -98,138 +226,140 @@ class OHdioDownloader:
             self.logger.error(f"Single audiobook download failed: {e}")
             return False
     
-    async def _discover_audiobooks(self, category_url: Optional[str] = None) -> List[AudiobookInfo]:
-        """Discover audiobooks from the category page.
+    async def _discover_audiobooks(
+        self, 
+        queue: asyncio.Queue, 
+        category_url: Optional[str] = None
+    ) -> None:
+        """Stream discovered audiobooks into the processing queue.
+        
+        Produces into the bounded queue as the category page is parsed,
+        so workers start on early books while discovery continues; the
+        queue bound applies back-pressure instead of buffering the whole
+        catalog.
         
         Args:
+            queue: Queue consumed by the processing workers
             category_url: Custom category URL
-            
-        Returns:
-            List of discovered audiobooks
         """
         self.logger.info("Discovering audiobooks...")
         
         with LoggingContext(phase="discovery"):
-            audiobooks = await self.category_scraper.scrape_category(category_url)
-            self.stats['discovered'] = len(audiobooks)
-            
-            self.logger.info(f"Discovered {len(audiobooks)} audiobooks")
-            
-            # Log sample of discovered books
-            for i, book in enumerate(audiobooks[:5]):
-                self.logger.info(f"  {i+1}. '{book.title}' by {book.author}")
+            async for book in self.category_scraper.iter_category(category_url):
+                self.stats['discovered'] += 1
+                
+                # Log sample of discovered books
+                if self.stats['discovered'] <= 5:
+                    self.logger.info(f"  {self.stats['discovered']}. '{book.title}' by {book.author}")
+                
+                await queue.put(book)
             
-            if len(audiobooks) > 5:
-                self.logger.info(f"  ... and {len(audiobooks) - 5} more")
+            if self.stats['discovered'] > 5:
+                self.logger.info(f"  ... and {self.stats['discovered'] - 5} more")
             
-            return audiobooks
-    
-    async def _process_audiobooks(self, audiobooks: List[AudiobookInfo]) -> None:
-        """Process all discovered audiobooks.
-        
-        Args:
-            audiobooks: List of audiobooks to process
-        """
-        self.logger.info(f"Processing {len(audiobooks)} audiobooks...")
-        
-        # Create semaphore to limit concurrent downloads
-        semaphore = asyncio.Semaphore(self.config.max_concurrent_downloads)
-        
-        # Create tasks for concurrent processing
-        tasks = []
-        for audiobook in audiobooks:
-            task = asyncio.create_task(
-                self._process_with_semaphore(semaphore, audiobook)
-            )
-            tasks.append(task)
-        
-        # Wait for all tasks to complete
-        await asyncio.gather(*tasks, return_exceptions=True)
+            self.logger.info(f"Discovered {self.stats['discovered']} audiobooks")
     
-    async def _process_with_semaphore(
-        self, 
-        semaphore: asyncio.Semaphore, 
-        audiobook: AudiobookInfo
-    ) -> None:
-        """Process a single audiobook with semaphore control.
+    async def _process_worker(self, queue: asyncio.Queue, counts: Counter) -> None:
+        """Drain audiobooks from the queue until the shutdown sentinel.
         
         Args:
-            semaphore: Asyncio semaphore for concurrency control
-            audiobook: Audiobook to process
+            queue: Queue of AudiobookInfo items, terminated by None
+            counts: Worker-local tally of outcomes, merged by the caller
         """
-        async with semaphore:
-            await self._process_single_audiobook(audiobook)
+        while True:
+            audiobook = await queue.get()
+            if audiobook is None:
+                return
+            
+            counts['processed'] += 1
+            try:
+                counts[await self._process_single_audiobook(audiobook)] += 1
+            except Exception as e:
+                # Expected scraper and download errors are handled inside
+                # _process_single_audiobook; this guards the worker itself
+                # so one surprise cannot stall the whole queue
+                self.logger.error(f"Worker error processing '{audiobook.title}': {e}")
+                counts['failed'] += 1
             
             # Add delay between requests
-            if self.config.delay_between_requests > 0:
-                await asyncio.sleep(self.config.delay_between_requests)
+            if self._delay > 0:
+                await asyncio.sleep(self._delay)
     
-    async def _process_single_audiobook(self, audiobook: AudiobookInfo) -> bool:
+    async def _process_single_audiobook(self, audiobook: AudiobookInfo) -> str:
         """Process a single audiobook through the complete pipeline.
         
         Args:
             audiobook: Audiobook to process
             
         Returns:
-            True if successful, False otherwise
+            Outcome key: 'downloaded', 'skipped' or 'failed'
         """
         with LoggingContext(book_title=audiobook.title, book_author=audiobook.author):
             try:
-                self.stats['processed'] += 1
-                
                 # Step 1: Extract metadata and playlist URL
                 self.logger.info(f"Processing '{audiobook.title}' by {audiobook.author}")
                 metadata = await self.audiobook_scraper.scrape_audiobook(audiobook.url)
                 
                 if not metadata:
                     self.logger.error("Failed to extract metadata")
-                    self.stats['failed'] += 1
-                    return False
+                    return 'failed'
                 
                 if not metadata.playlist_url:
                     self.logger.error("No playlist URL found")
-                    self.stats['failed'] += 1
-                    return False
+                    return 'failed'
                 
                 # Step 2: Check if file already exists
                 filename = self.downloader._generate_filename(metadata.title, metadata.author)
-                output_path = Path(self.config.output_directory) / filename
                 
-                if self.config.skip_existing and output_path.exists():
+                if self._skip_existing and filename in self._existing_files:
                     self.logger.info("File already exists, skipping")
-                    self.stats['skipped'] += 1
-                    return True
+                    return 'skipped'
                 
-                # Step 3: Download the audiobook
+                # Step 3: Download the audiobook, gated separately from
+                # scraping so wide metadata fan-out cannot pile up yt-dlp
+                # instances
                 progress_tracker = DownloadProgress(metadata.title, metadata.author)
-                downloaded_file = await self.downloader.download_audiobook(
-                    metadata.playlist_url,
-                    metadata.title,
-                    metadata.author,
-                    progress_callback=progress_tracker.update
-                )
+                if self._download_gate is None:
+                    self._download_gate = AdmissionController(self.config.max_concurrent_downloads)
+                async with self._download_gate:
+                    downloaded_file = await self.downloader.download_audiobook(
+                        metadata.playlist_url,
+                        metadata.title,
+                        metadata.author,
+                        progress_callback=progress_tracker.update
+                    )
                 
                 if not downloaded_file:
                     self.logger.error("Download failed")
-                    self.stats['failed'] += 1
-                    return False
+                    return 'failed'
                 
-                # Step 4: Embed metadata
-                if self.config.embed_metadata:
-                    success = self.metadata_manager.embed_metadata(downloaded_file, metadata)
+                # Step 4: Embed metadata. Tag writing is blocking file
+                # I/O plus a JPEG re-encode for new covers; running it in
+                # a thread keeps the event loop servicing the other
+                # workers' download sockets meanwhile
+                if self._embed_metadata:
+                    loop = asyncio.get_event_loop()
+                    success = await loop.run_in_executor(
+                        None,
+                        self.metadata_manager.embed_metadata,
+                        downloaded_file,
+                        metadata
+                    )
                     if success:
                         self.logger.info("Metadata embedded successfully")
                     else:
                         self.logger.warning("Failed to embed metadata")
                 
-                self.stats['downloaded'] += 1
+                self._existing_files.add(filename)
+                self._unsaved_downloads += 1
+                if self._unsaved_downloads >= self.INDEX_FLUSH_EVERY:
+                    self._save_index()
                 self.logger.info(f"Successfully completed '{metadata.title}'")
-                return True
+                return 'downloaded'
                 
             except Exception as e:
                 self.logger.error(f"Error processing audiobook: {e}")
-                self.stats['failed'] += 1
-                return False
+                return 'failed'
     
     def _print_summary(self) -> None:
         """Print download summary statistics."""
@@ -266,16 +396,15 @@ async def main():
     )
     
     try:
-        # Initialize downloader
-        downloader = OHdioDownloader(args.config)
-        
-        if args.url:
-            # Single URL download
-            success = await downloader.download_single_audiobook(args.url)
-            sys.exit(0 if success else 1)
-        else:
-            # Download all audiobooks
-            await downloader.download_all_audiobooks(args.category)
+        # The context manager owns the shared HTTP session lifecycle
+        async with OHdioDownloader(args.config) as downloader:
+            if args.url:
+                # Single URL download
+                success = await downloader.download_single_audiobook(args.url)
+                sys.exit(0 if success else 1)
+            else:
+                # Download all audiobooks
+                await downloader.download_all_audiobooks(args.category)
             
     except KeyboardInterrupt:
         print("\nDownload interrupted by user")
@@ -283,6 +412,10 @@ async def main():
     except Exception as e:
         logging.error(f"Application error: {e}")
         sys.exit(1)
+    finally:
+        # Flush queued log records
+        from .utils.logger import shutdown_logging
+        shutdown_logging()
 
 
 if __name__ == "__main__":
@@ -2,16 +2,154 @@
 
 import asyncio
 import logging
+import os
+import re
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
 from ..utils.network_utils import safe_request, download_file
 from .playlist_extractor import PlaylistExtractor
 
 
+# Selector lists shared by the Lexbor fast path and the BeautifulSoup
+# fallback, hoisted so neither path rebuilds them per page
+_TITLE_SELECTORS = (
+    'h1',
+    '.title',
+    '.book-title',
+    '.audiobook-title',
+    '[data-title]',
+    'meta[property="og:title"]',
+    'title',
+)
+_AUTHOR_SELECTORS = (
+    '.author',
+    '.book-author',
+    '.by-author',
+    '[data-author]',
+    'meta[name="author"]',
+    'meta[property="book:author"]',
+)
+_DESCRIPTION_SELECTORS = (
+    '.description',
+    '.summary',
+    '.synopsis',
+    '.excerpt',
+    'meta[name="description"]',
+    'meta[property="og:description"]',
+    '.book-description',
+    '.content-description',
+)
+_DURATION_SELECTORS = (
+    '.duration',
+    '.length',
+    '.runtime',
+    '[data-duration]',
+    'meta[property="video:duration"]',
+)
+_DATE_SELECTORS = (
+    '.publication-date',
+    '.publish-date',
+    '.date',
+    'meta[property="book:release_date"]',
+    'meta[name="publication_date"]',
+    'time[datetime]',
+)
+_GENRE_SELECTORS = (
+    '.genre',
+    '.category',
+    '.book-genre',
+    'meta[property="book:genre"]',
+    'meta[name="genre"]',
+)
+_THUMBNAIL_SELECTORS = (
+    '.book-cover img',
+    '.cover img',
+    '.thumbnail img',
+    'meta[property="og:image"]',
+    'meta[name="twitter:image"]',
+    '.audiobook-cover img',
+)
+_ISBN_SELECTORS = (
+    'meta[property="book:isbn"]',
+    'meta[name="isbn"]',
+    '.isbn',
+)
+_PUBLISHER_SELECTORS = (
+    '.publisher',
+    '.book-publisher',
+    'meta[property="book:publisher"]',
+    'meta[name="publisher"]',
+)
+_NARRATOR_SELECTORS = (
+    '.narrator',
+    '.reader',
+    '.voice-actor',
+    '.read-by',
+)
+_SERIES_SELECTORS = (
+    '.series',
+    '.book-series',
+    '.series-info',
+)
+
+# Pattern-scan fallbacks, compiled once at import
+_HTML_AUTHOR_PATTERNS = (
+    re.compile(r">Écrit\s+par\s+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)<", re.IGNORECASE),
+    re.compile(r"class=\"[^\"]*animator[^\"]*\">Écrit\s+par\s+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)<", re.IGNORECASE),
+)
+_TEXT_AUTHOR_PATTERNS = (
+    re.compile(r"Écrit\s+par\s+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)(?:\s|$)", re.IGNORECASE),
+    re.compile(r"auteur[:\s]+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)(?:\s|$)", re.IGNORECASE),
+    re.compile(r"by\s+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)(?:\s|$)", re.IGNORECASE),
+    re.compile(r"de\s+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)(?:\s|$)", re.IGNORECASE),
+)
+_DURATION_TEXT_PATTERNS = (
+    re.compile(r'(\d+h\s*\d+min?)', re.IGNORECASE),
+    re.compile(r'(\d+:\d+:\d+)', re.IGNORECASE),
+    re.compile(r'(\d+\s*heures?\s*\d+\s*minutes?)', re.IGNORECASE),
+    re.compile(r'Durée[:\s]*([^.]+)', re.IGNORECASE),
+)
+_SERIES_PATTERNS = (
+    re.compile(r'(.+?)\s*#(\d+)', re.IGNORECASE),
+    re.compile(r'(.+?),?\s*tome\s*(\d+)', re.IGNORECASE),
+    re.compile(r'(.+?),?\s*volume\s*(\d+)', re.IGNORECASE),
+)
+
+
+def _lx_first(tree, selectors) -> Optional[str]:
+    """Return the first non-empty value matched by the given selectors.
+
+    Lexbor counterpart of the select_one loops in the BeautifulSoup
+    helpers: meta tags yield their content attribute, images their src,
+    time elements their datetime, anything else its text.
+    """
+    for selector in selectors:
+        node = tree.css_first(selector)
+        if node is None:
+            continue
+        if node.tag == 'meta':
+            value = node.attributes.get('content')
+        elif node.tag == 'img':
+            value = node.attributes.get('src') or node.attributes.get('data-src')
+        elif node.tag == 'time':
+            value = node.attributes.get('datetime') or node.text(strip=True)
+        else:
+            value = node.text(strip=True)
+        if value:
+            return value.strip()
+    return None
+
+
 @dataclass
 class AudiobookMetadata:
     """Complete metadata for an audiobook."""
@@ -47,25 +185,27 @@ class AudiobookScraper:
         self.logger = logging.getLogger(__name__)
         self.playlist_extractor = PlaylistExtractor()
     
-    async def scrape_audiobook(self, book_url: str) -> Optional[AudiobookMetadata]:
+    async def scrape_audiobook(self, book_url: str, page_content: Optional[str] = None) -> Optional[AudiobookMetadata]:
         """Extract all metadata and playlist URL from an audiobook page.
         
         Args:
             book_url: URL of the audiobook page
+            page_content: Optional prefetched HTML, skipping the page request
             
         Returns:
             AudiobookMetadata object or None if scraping failed
         """
         self.logger.info(f"Scraping audiobook: {book_url}")
         
-        # Get the page content
-        headers = self.config.get_headers()
-        page_content = await safe_request(
-            book_url,
-            headers=headers,
-            max_retries=self.config.retry_attempts,
-            delay=self.config.delay_between_requests
-        )
+        # Get the page content unless the caller already has it
+        if page_content is None:
+            headers = self.config.get_headers()
+            page_content = await safe_request(
+                book_url,
+                headers=headers,
+                max_retries=self.config.retry_attempts,
+                delay=self.config.delay_between_requests
+            )
         
         if not page_content:
             self.logger.error(f"Failed to fetch audiobook page: {book_url}")
@@ -91,6 +231,11 @@ class AudiobookScraper:
         Returns:
             AudiobookMetadata object or None
         """
+        # Lexbor (selectolax) parses several times faster than
+        # BeautifulSoup; keep the bs4 path for when it is not installed
+        if HAS_SELECTOLAX and not os.getenv('OHDIO_FORCE_BS4'):
+            return await self._extract_metadata_lexbor(page_content, page_url)
+        
         soup = BeautifulSoup(page_content, 'html.parser')
         
         # Extract basic information
@@ -140,6 +285,66 @@ class AudiobookScraper:
         
         return metadata
     
+    async def _extract_metadata_lexbor(self, page_content: str, page_url: str) -> Optional[AudiobookMetadata]:
+        """Extract metadata using the Lexbor C parser.
+        
+        Walks the same selector lists as the BeautifulSoup path but parses
+        the page once with selectolax.
+        
+        Args:
+            page_content: HTML content of the page
+            page_url: URL of the page
+            
+        Returns:
+            AudiobookMetadata object or None
+        """
+        tree = LexborHTMLParser(page_content)
+        text_content = tree.root.text(separator='\n') if tree.root is not None else ''
+        
+        title = _lx_first(tree, _TITLE_SELECTORS)
+        if title:
+            title = self._clean_title(title)
+        
+        author = _lx_first(tree, _AUTHOR_SELECTORS)
+        if author:
+            author = self._clean_author(author)
+        if not author:
+            author = self._extract_author_from_text(page_content, text_content)
+        
+        if not title or not author:
+            self.logger.warning(f"Missing basic info - title: '{title}', author: '{author}'")
+            return None
+        
+        playlist_url = self.playlist_extractor.extract_playlist_url(page_content, page_url)
+        
+        thumbnail_url = _lx_first(tree, _THUMBNAIL_SELECTORS)
+        if thumbnail_url:
+            thumbnail_url = urljoin(page_url, thumbnail_url)
+        
+        thumbnail_data = None
+        if thumbnail_url:
+            thumbnail_data = await self._download_thumbnail(thumbnail_url)
+        
+        series_info = self._parse_series_text(_lx_first(tree, _SERIES_SELECTORS))
+        
+        return AudiobookMetadata(
+            title=title,
+            author=author,
+            url=page_url,
+            playlist_url=playlist_url,
+            description=_lx_first(tree, _DESCRIPTION_SELECTORS),
+            duration=_lx_first(tree, _DURATION_SELECTORS) or self._find_duration_in_text(text_content),
+            publication_date=_lx_first(tree, _DATE_SELECTORS),
+            genre=_lx_first(tree, _GENRE_SELECTORS) or "Jeunesse",
+            thumbnail_url=thumbnail_url,
+            thumbnail_data=thumbnail_data,
+            isbn=_lx_first(tree, _ISBN_SELECTORS),
+            publisher=_lx_first(tree, _PUBLISHER_SELECTORS),
+            narrator=_lx_first(tree, _NARRATOR_SELECTORS) or self._find_narrator_in_text(text_content),
+            series=series_info.get('series') if series_info else None,
+            series_number=series_info.get('number') if series_info else None,
+        )
+    
     def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract book title from the page.
         
@@ -149,16 +354,7 @@ class AudiobookScraper:
         Returns:
             Book title or None
         """
-        # Try different selectors for title
-        selectors = [
-            'h1',
-            '.title',
-            '.book-title',
-            '.audiobook-title',
-            '[data-title]',
-            'meta[property="og:title"]',
-            'title',
-        ]
+        selectors = _TITLE_SELECTORS
         
         for selector in selectors:
             try:
@@ -188,15 +384,7 @@ class AudiobookScraper:
         Returns:
             Book author or None
         """
-        # Try different selectors for author
-        selectors = [
-            '.author',
-            '.book-author',
-            '.by-author',
-            '[data-author]',
-            'meta[name="author"]',
-            'meta[property="book:author"]',
-        ]
+        selectors = _AUTHOR_SELECTORS
         
         for selector in selectors:
             try:
@@ -215,54 +403,36 @@ class AudiobookScraper:
             except Exception as e:
                 self.logger.debug(f"Error extracting author with selector {selector}: {e}")
         
-        # Try to find author in HTML content first, then text content
-        import re
-        
-        # First search in HTML content to preserve structure
-        html_content = str(soup)
-        
-        # Look for specific patterns in HTML, prioritizing "Écrit par" (author) over "Lu par" (narrator)
-        html_author_patterns = [
-            r'>Écrit\s+par\s+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)<',
-            r'class="[^"]*animator[^"]*">Écrit\s+par\s+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)<',
-        ]
+        # Fall back to pattern scans over the raw HTML and text content
+        return self._extract_author_from_text(str(soup), soup.get_text())
+    
+    def _extract_author_from_text(self, html_content: str, text_content: str) -> Optional[str]:
+        """Find the author via pattern scans when no selector matched.
         
-        for pattern in html_author_patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
+        Args:
+            html_content: Raw HTML of the page
+            text_content: Plain text of the page
+            
+        Returns:
+            Book author or None
+        """
+        # Search the HTML first to preserve structure, prioritizing
+        # "Écrit par" (author) over "Lu par" (narrator)
+        for pattern in _HTML_AUTHOR_PATTERNS:
+            match = pattern.search(html_content)
             if match:
-                author = match.group(1).strip()
-                # Clean up the author name
-                author = re.sub(r'[^\w\s\-\'À-ÿ]', '', author)  # Remove non-alphanumeric except spaces, hyphens, apostrophes
-                author = ' '.join(author.split())  # Normalize whitespace
-                
-                # Validate that it looks like a real name (1-3 words, reasonable length)
-                words = author.split()
-                if 1 <= len(words) <= 3 and 2 <= len(author) <= 50:
+                author = self._normalize_author_name(match.group(1))
+                if author:
                     return author
         
         # If not found in HTML, try text content
-        text_content = soup.get_text()
-        text_author_patterns = [
-            r'Écrit\s+par\s+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)(?:\s|$)',
-            r'auteur[:\s]+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)(?:\s|$)',
-            r'by\s+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)(?:\s|$)',
-            r'de\s+([A-Z][a-zA-ZÀ-ÿ\s\-\']+?)(?:\s|$)',
-        ]
-        
-        for pattern in text_author_patterns:
-            match = re.search(pattern, text_content, re.IGNORECASE)
+        for pattern in _TEXT_AUTHOR_PATTERNS:
+            match = pattern.search(text_content)
             if match:
-                author = match.group(1).strip()
-                # Clean up the author name
-                author = re.sub(r'[^\w\s\-\'À-ÿ]', '', author)  # Remove non-alphanumeric except spaces, hyphens, apostrophes
-                author = ' '.join(author.split())  # Normalize whitespace
-                
-                # Validate that it looks like a real name (1-3 words, reasonable length)
-                words = author.split()
-                if 1 <= len(words) <= 3 and 2 <= len(author) <= 50:
-                    # Check if each word starts with a capital letter
-                    if all(word[0].isupper() for word in words if word):
-                        return author
+                author = self._normalize_author_name(match.group(1))
+                # Check if each word starts with a capital letter
+                if author and all(word[0].isupper() for word in author.split() if word):
+                    return author
         
         # Fallback: look for simple patterns in individual lines
         for line in text_content.split('\n'):
@@ -279,6 +449,25 @@ class AudiobookScraper:
         
         return None
     
+    def _normalize_author_name(self, author: str) -> Optional[str]:
+        """Clean a matched author string and validate it looks like a name.
+        
+        Args:
+            author: Raw matched author text
+            
+        Returns:
+            Cleaned author name or None if it fails validation
+        """
+        # Remove non-alphanumeric except spaces, hyphens, apostrophes
+        author = re.sub(r"[^\w\s\-'À-ÿ]", '', author)
+        author = ' '.join(author.split())  # Normalize whitespace
+        
+        # Validate that it looks like a real name (1-3 words, reasonable length)
+        words = author.split()
+        if 1 <= len(words) <= 3 and 2 <= len(author) <= 50:
+            return author
+        return None
+    
     def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract book description from the page.
         
@@ -288,16 +477,7 @@ class AudiobookScraper:
         Returns:
             Book description or None
         """
-        selectors = [
-            '.description',
-            '.summary',
-            '.synopsis',
-            '.excerpt',
-            'meta[name="description"]',
-            'meta[property="og:description"]',
-            '.book-description',
-            '.content-description',
-        ]
+        selectors = _DESCRIPTION_SELECTORS
         
         for selector in selectors:
             try:
@@ -324,13 +504,7 @@ class AudiobookScraper:
         Returns:
             Duration string or None
         """
-        selectors = [
-            '.duration',
-            '.length',
-            '.runtime',
-            '[data-duration]',
-            'meta[property="video:duration"]',
-        ]
+        selectors = _DURATION_SELECTORS
         
         for selector in selectors:
             try:
@@ -347,17 +521,19 @@ class AudiobookScraper:
                 self.logger.debug(f"Error extracting duration with selector {selector}: {e}")
         
         # Look for duration patterns in text
-        import re
-        text_content = soup.get_text()
-        duration_patterns = [
-            r'(\d+h\s*\d+min?)',
-            r'(\d+:\d+:\d+)',
-            r'(\d+\s*heures?\s*\d+\s*minutes?)',
-            r'Durée[:\s]*([^.]+)',
-        ]
+        return self._find_duration_in_text(soup.get_text())
+    
+    def _find_duration_in_text(self, text_content: str) -> Optional[str]:
+        """Look for duration patterns in plain text content.
         
-        for pattern in duration_patterns:
-            match = re.search(pattern, text_content, re.IGNORECASE)
+        Args:
+            text_content: Plain text of the page
+            
+        Returns:
+            Duration string or None
+        """
+        for pattern in _DURATION_TEXT_PATTERNS:
+            match = pattern.search(text_content)
             if match:
                 return match.group(1).strip()
         
@@ -372,14 +548,7 @@ class AudiobookScraper:
         Returns:
             Publication date string or None
         """
-        selectors = [
-            '.publication-date',
-            '.publish-date',
-            '.date',
-            'meta[property="book:release_date"]',
-            'meta[name="publication_date"]',
-            'time[datetime]',
-        ]
+        selectors = _DATE_SELECTORS
         
         for selector in selectors:
             try:
@@ -408,13 +577,7 @@ class AudiobookScraper:
         Returns:
             Genre string or None
         """
-        selectors = [
-            '.genre',
-            '.category',
-            '.book-genre',
-            'meta[property="book:genre"]',
-            'meta[name="genre"]',
-        ]
+        selectors = _GENRE_SELECTORS
         
         for selector in selectors:
             try:
@@ -443,14 +606,7 @@ class AudiobookScraper:
         Returns:
             Thumbnail URL or None
         """
-        selectors = [
-            '.book-cover img',
-            '.cover img',
-            '.thumbnail img',
-            'meta[property="og:image"]',
-            'meta[name="twitter:image"]',
-            '.audiobook-cover img',
-        ]
+        selectors = _THUMBNAIL_SELECTORS
         
         for selector in selectors:
             try:
@@ -477,11 +633,7 @@ class AudiobookScraper:
         Returns:
             ISBN string or None
         """
-        selectors = [
-            'meta[property="book:isbn"]',
-            'meta[name="isbn"]',
-            '.isbn',
-        ]
+        selectors = _ISBN_SELECTORS
         
         for selector in selectors:
             try:
@@ -508,12 +660,7 @@ class AudiobookScraper:
         Returns:
             Publisher string or None
         """
-        selectors = [
-            '.publisher',
-            '.book-publisher',
-            'meta[property="book:publisher"]',
-            'meta[name="publisher"]',
-        ]
+        selectors = _PUBLISHER_SELECTORS
         
         for selector in selectors:
             try:
@@ -540,12 +687,7 @@ class AudiobookScraper:
         Returns:
             Narrator string or None
         """
-        selectors = [
-            '.narrator',
-            '.reader',
-            '.voice-actor',
-            '.read-by',
-        ]
+        selectors = _NARRATOR_SELECTORS
         
         for selector in selectors:
             try:
@@ -558,7 +700,17 @@ class AudiobookScraper:
                 self.logger.debug(f"Error extracting narrator with selector {selector}: {e}")
         
         # Look for narrator in text content
-        text_content = soup.get_text()
+        return self._find_narrator_in_text(soup.get_text())
+    
+    def _find_narrator_in_text(self, text_content: str) -> Optional[str]:
+        """Look for the narrator in plain text content.
+        
+        Args:
+            text_content: Plain text of the page
+            
+        Returns:
+            Narrator name or None
+        """
         for line in text_content.split('\n'):
             line = line.strip()
             if any(keyword in line.lower() for keyword in ['lu par', 'narré par', 'read by']):
@@ -579,11 +731,7 @@ class AudiobookScraper:
         Returns:
             Dictionary with series info or None
         """
-        selectors = [
-            '.series',
-            '.book-series',
-            '.series-info',
-        ]
+        selectors = _SERIES_SELECTORS
         
         for selector in selectors:
             try:
@@ -591,30 +739,35 @@ class AudiobookScraper:
                 if element:
                     text = element.get_text(strip=True)
                     if text:
-                        # Try to extract series name and number
-                        import re
-                        # Pattern like "Series Name #3" or "Series Name, tome 3"
-                        patterns = [
-                            r'(.+?)\s*#(\d+)',
-                            r'(.+?),?\s*tome\s*(\d+)',
-                            r'(.+?),?\s*volume\s*(\d+)',
-                        ]
-                        
-                        for pattern in patterns:
-                            match = re.match(pattern, text, re.IGNORECASE)
-                            if match:
-                                return {
-                                    'series': match.group(1).strip(),
-                                    'number': int(match.group(2))
-                                }
-                        
-                        # Just series name without number
-                        return {'series': text, 'number': None}
+                        return self._parse_series_text(text)
             except Exception as e:
                 self.logger.debug(f"Error extracting series with selector {selector}: {e}")
         
         return None
     
+    def _parse_series_text(self, text: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Parse series name and number out of a series label.
+        
+        Args:
+            text: Series label text like "Series Name #3" or "Series Name, tome 3"
+            
+        Returns:
+            Dictionary with series info or None
+        """
+        if not text:
+            return None
+        
+        for pattern in _SERIES_PATTERNS:
+            match = pattern.match(text)
+            if match:
+                return {
+                    'series': match.group(1).strip(),
+                    'number': int(match.group(2))
+                }
+        
+        # Just series name without number
+        return {'series': text, 'number': None}
+    
     def _clean_title(self, title: str) -> str:
         """Clean up extracted title.
         
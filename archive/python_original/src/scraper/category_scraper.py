@@ -2,18 +2,75 @@
 
 import asyncio
 import logging
-from dataclasses import dataclass
-from typing import List, Optional
+import os
+import re
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
 from urllib.parse import urljoin, urlparse
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+try:
+    from pybloom_live import ScalableBloomFilter
+    HAS_PYBLOOM = True
+except ImportError:
+    HAS_PYBLOOM = False
+
+from ..utils.http_client import get_session
 from ..utils.network_utils import safe_request
 
 
-@dataclass
+# Selectors compiled once at import; soupsieve otherwise recompiles the
+# string into a matcher on every select call
+_AUDIOBOOK_LINK = sv.compile('a[href*="livres-audio"]')
+_AUTHOR_SELECTOR = sv.compile(
+    '.author, .book-author, .by-author, '
+    'p:-soup-contains("par"), span:-soup-contains("par"), [data-author]'
+)
+_DESC_SELECTORS = tuple(sv.compile(s) for s in (
+    '.description',
+    '.summary',
+    '.excerpt',
+    'p.description',
+    '[data-description]',
+))
+
+
+# Single case-insensitive scan replacing the keyword list's repeated
+# .lower() allocations and double substring passes per sibling
+_AUTHOR_RX = re.compile(r'(?:par|by|auteur\s*:?)\s+(.+)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=8192)
+def _resolve_url(base_url: str, href: str) -> str:
+    """Resolve href against base_url, memoized for repeated sightings.
+    
+    urljoin reparses the base URL on every call; the same base/href pair
+    shows up repeatedly (anchors, thumbnails, duplicate cards), so the
+    cache turns those into dict hits.
+    """
+    # Absolute URLs need no resolution at all
+    if href.startswith('http://') or href.startswith('https://'):
+        return href
+    return urljoin(base_url, href)
+
+
+@dataclass(slots=True, frozen=True)
 class AudiobookInfo:
-    """Information about an audiobook discovered from category page."""
+    """Information about an audiobook discovered from category page.
+    
+    Slotted and frozen: a crawl produces thousands of these, so the slots
+    layout halves the per-instance footprint, and immutability makes them
+    safely hashable and shareable across tasks.
+    """
     
     title: str
     author: str
@@ -48,235 +105,278 @@ class CategoryScraper:
         if category_url is None:
             category_url = self.JEUNESSE_CATEGORY_URL
         
-        self.logger.info(f"Scraping category page: {category_url}")
+        self.logger.info("Scraping category page: %s", category_url)
         
-        # Get the page content
+        # Get the page content over the shared pooled session
         headers = self.config.get_headers()
+        session = await get_session()
         page_content = await safe_request(
             category_url,
             headers=headers,
             max_retries=self.config.retry_attempts,
-            delay=self.config.delay_between_requests
+            delay=self.config.delay_between_requests,
+            session=session
         )
         
         if not page_content:
-            self.logger.error(f"Failed to fetch category page: {category_url}")
+            self.logger.error("Failed to fetch category page: %s", category_url)
             return []
         
         # Parse the page to extract audiobooks
         audiobooks = self._parse_category_page(page_content, category_url)
         
-        self.logger.info(f"Found {len(audiobooks)} audiobooks in category")
+        self.logger.info("Found %d audiobooks in category", len(audiobooks))
         return audiobooks
     
-    def _parse_category_page(self, page_content: str, base_url: str) -> List[AudiobookInfo]:
-        """Parse the category page HTML to extract audiobook information.
+    async def iter_category(self, category_url: Optional[str] = None) -> AsyncIterator[AudiobookInfo]:
+        """Yield audiobooks from a category page as they are parsed.
+        
+        Lets callers interleave per-book work (filesystem probes, metadata
+        fetches) with iteration instead of waiting on the full list. Today a
+        category is a single page, so the yields start after one fetch; once
+        pagination exists this is where page fan-out belongs.
         
         Args:
-            page_content: HTML content of the category page
-            base_url: Base URL for resolving relative links
+            category_url: URL of the category page (defaults to Jeunesse category)
             
-        Returns:
-            List of AudiobookInfo objects
+        Yields:
+            AudiobookInfo objects as they are discovered
         """
-        soup = BeautifulSoup(page_content, 'html.parser')
-        audiobooks = []
-        
-        # Try different parsing strategies based on the page structure
-        parsing_methods = [
-            self._parse_index_grid_items,  # New method for index-grid-item elements
-            self._parse_book_items,
-            self._parse_livre_audio_sections,
-            self._parse_generic_links,
-        ]
-        
-        for method in parsing_methods:
-            try:
-                books = method(soup, base_url)
-                if books:
-                    audiobooks.extend(books)
-                    self.logger.debug(f"Found {len(books)} books using {method.__name__}")
-            except Exception as e:
-                self.logger.warning(f"Error in parsing method {method.__name__}: {e}")
-        
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_audiobooks = []
-        for book in audiobooks:
-            if book.url not in seen_urls:
-                seen_urls.add(book.url)
-                unique_audiobooks.append(book)
-        
-        return unique_audiobooks
+        for book in await self.scrape_category(category_url):
+            yield book
     
-    def _parse_index_grid_items(self, soup: BeautifulSoup, base_url: str) -> List[AudiobookInfo]:
-        """Parse audiobook items using index-grid-item class specifically.
+    async def scrape_categories(self, category_urls: List[str], concurrency: int = 10) -> List[AudiobookInfo]:
+        """Scrape several category pages concurrently.
+        
+        Network latency dominates category fetches, so overlapping the
+        requests turns a sequential crawl into roughly the slowest single
+        fetch. All requests share the pooled HTTP session.
         
         Args:
-            soup: BeautifulSoup object of the page
-            base_url: Base URL for resolving relative links
+            category_urls: URLs of the category pages to scrape
+            concurrency: Maximum number of pages fetched at once
             
         Returns:
-            List of AudiobookInfo objects
+            Combined list of AudiobookInfo objects, deduplicated by URL
         """
-        audiobooks = []
+        semaphore = asyncio.Semaphore(concurrency)
         
-        # Find all elements with class index-grid-item
-        grid_items = soup.find_all(class_='index-grid-item')
-        self.logger.debug(f"Found {len(grid_items)} index-grid-item elements")
+        async def scrape_one(url: str) -> List[AudiobookInfo]:
+            async with semaphore:
+                return await self.scrape_category(url)
         
-        for item in grid_items:
-            # Look for audiobook links within each grid item
-            audiobook_links = item.find_all('a', href=lambda href: href and 'livres-audio' in href)
-            
-            for link in audiobook_links:
-                href = link.get('href')
-                if not href:
-                    continue
-                
-                full_url = urljoin(base_url, href)
-                
-                # Extract title from the link text or span
-                title = self._extract_title_from_link(link)
-                author = self._extract_author_from_link(link) or "Unknown Author"  # Default if not found
-                thumbnail_url = self._extract_thumbnail_from_link(link, base_url)
-                
-                if title:  # Only require title, not author
-                    book = AudiobookInfo(
-                        title=title,
-                        author=author,
-                        url=full_url,
-                        thumbnail_url=thumbnail_url
-                    )
+        results = await asyncio.gather(*[scrape_one(url) for url in category_urls])
+        
+        # Deduplicate across categories (a book can appear in several)
+        seen_urls = set()
+        audiobooks = []
+        for books in results:
+            for book in books:
+                if book.url not in seen_urls:
+                    seen_urls.add(book.url)
                     audiobooks.append(book)
-                    self.logger.debug(f"Added book from grid item: {title} by {author}")
         
+        self.logger.info("Found %d unique audiobooks across %d categories", len(audiobooks), len(category_urls))
         return audiobooks
     
-    def _parse_book_items(self, soup: BeautifulSoup, base_url: str) -> List[AudiobookInfo]:
-        """Parse audiobook items using common CSS selectors.
+    def _parse_category_page(self, page_content: str, base_url: str) -> List[AudiobookInfo]:
+        """Parse the category page HTML to extract audiobook information.
         
         Args:
-            soup: BeautifulSoup object of the page
+            page_content: HTML content of the category page
             base_url: Base URL for resolving relative links
             
         Returns:
             List of AudiobookInfo objects
         """
-        audiobooks = []
-        
-        # Common selectors for audiobook items
-        selectors = [
-            'article[data-type="livres-audio"]',
-            '.livre-audio',
-            '.audiobook-item',
-            'article:has(a[href*="livres-audio"])',
-            'div:has(a[href*="livres-audio"])',
-        ]
-        
-        for selector in selectors:
-            try:
-                items = soup.select(selector)
-                if items:
-                    self.logger.debug(f"Found {len(items)} items with selector: {selector}")
-                    for item in items:
-                        book = self._extract_book_info_from_element(item, base_url)
-                        if book:
-                            audiobooks.append(book)
-                    break  # Use first successful selector
-            except Exception as e:
-                self.logger.debug(f"Selector {selector} failed: {e}")
+        # Fast path: selectolax keeps the DOM in C memory and only builds
+        # Python objects for the nodes we touch, so parsing is several times
+        # cheaper than BeautifulSoup. Falls back to the BS4 pass when
+        # selectolax is unavailable, disabled, or finds nothing.
+        if HAS_SELECTOLAX and not os.getenv('OHDIO_FORCE_BS4'):
+            audiobooks = self._parse_category_page_lexbor(page_content, base_url)
+            if audiobooks:
+                return audiobooks
+        
+        # lxml's C tokenizer and tree builder are several times faster than
+        # the pure-Python html.parser on realistic pages
+        soup = BeautifulSoup(page_content, 'lxml')
+        
+        # Single traversal: collect every audiobook anchor once, classify it
+        # by its nearest recognised ancestor, and merge duplicates by URL.
+        # Later sightings of a URL only upgrade fields the first left empty.
+        books = {}
+        for anchor in _AUDIOBOOK_LINK.select(soup):
+            href = anchor.get('href')
+            if not href:
                 continue
-        
-        return audiobooks
+            
+            container = (anchor.find_parent(class_='index-grid-item')
+                         or anchor.find_parent('article'))
+            if container is not None:
+                # Extract from this anchor, not the container's first one:
+                # two books sharing an ancestor card must each keep their
+                # own URL, with the container only enriching description
+                book = self._extract_book_info_from_element(
+                    container, base_url, anchor=anchor
+                )
+            else:
+                title = self._extract_title_from_link(anchor)
+                if not title:
+                    continue
+                book = AudiobookInfo(
+                    title=title,
+                    author=self._extract_author_from_link(anchor) or "Unknown Author",
+                    url=_resolve_url(base_url, href),
+                    thumbnail_url=self._extract_thumbnail_from_link(anchor, base_url)
+                )
+            
+            if book is None:
+                continue
+            
+            existing = books.get(book.url)
+            if existing is None:
+                books[book.url] = book
+                self.logger.debug("Added book: %s by %s", book.title, book.author)
+            else:
+                upgrades = {}
+                if existing.author == "Unknown Author" and book.author != "Unknown Author":
+                    upgrades['author'] = book.author
+                if not existing.thumbnail_url and book.thumbnail_url:
+                    upgrades['thumbnail_url'] = book.thumbnail_url
+                if not existing.description and book.description:
+                    upgrades['description'] = book.description
+                if upgrades:
+                    books[book.url] = replace(existing, **upgrades)
+        
+        return list(books.values())
     
-    def _parse_livre_audio_sections(self, soup: BeautifulSoup, base_url: str) -> List[AudiobookInfo]:
-        """Parse sections specifically containing 'Livre audio' text.
+    def _parse_category_page_lexbor(self, page_content: str, base_url: str) -> List[AudiobookInfo]:
+        """Parse the category page using selectolax's Lexbor engine.
         
         Args:
-            soup: BeautifulSoup object of the page
+            page_content: HTML content of the category page
             base_url: Base URL for resolving relative links
             
         Returns:
-            List of AudiobookInfo objects
+            List of AudiobookInfo objects (deduplicated by URL)
         """
+        tree = LexborHTMLParser(page_content)
+        
+        # Prefer links inside index-grid-item containers, mirroring the
+        # priority order of the BS4 strategies
+        links = []
+        for item in tree.css('.index-grid-item'):
+            links.extend(item.css('a[href*="livres-audio"]'))
+        if not links:
+            links = tree.css('a[href*="livres-audio"]')
+        
+        # A scalable Bloom filter keeps the membership test at ~10-13 bits
+        # per URL instead of ~120 bytes for an exact set, which matters once
+        # crawls span many category pages; the 1e-9 false-positive rate makes
+        # a wrongly skipped book vanishingly unlikely. Both containers share
+        # the `in`/`add` protocol, so the loop below is unchanged either way.
+        if HAS_PYBLOOM:
+            seen_urls = ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-9)
+        else:
+            seen_urls = set()
         audiobooks = []
-        
-        # Find all elements containing "Livre audio" text
-        livre_audio_elements = soup.find_all(text=lambda text: text and "Livre audio" in text)
-        
-        for element in livre_audio_elements:
-            # Navigate up to find the containing article/div
-            parent = element.parent
-            while parent and parent.name not in ['article', 'div', 'section']:
-                parent = parent.parent
+        for link in links:
+            href = link.attributes.get('href')
+            if not href:
+                continue
             
-            if parent:
-                # Look for the main container
-                container = parent
-                while container and container.parent and container.parent.name in ['div', 'section', 'article']:
-                    if len(container.parent.find_all('a', href=True)) > 0:
-                        container = container.parent
-                    else:
-                        break
-                
-                book = self._extract_book_info_from_element(container, base_url)
-                if book:
-                    audiobooks.append(book)
+            full_url = _resolve_url(base_url, href)
+            if full_url in seen_urls:
+                continue
+            
+            title = self._extract_title_from_node(link)
+            if not title:
+                continue
+            
+            seen_urls.add(full_url)
+            audiobooks.append(AudiobookInfo(
+                title=title,
+                author=self._extract_author_from_node(link) or "Unknown Author",
+                url=full_url,
+                thumbnail_url=self._extract_thumbnail_from_node(link, base_url)
+            ))
+            self.logger.debug("Added book from lexbor parse: %s", title)
         
         return audiobooks
     
-    def _parse_generic_links(self, soup: BeautifulSoup, base_url: str) -> List[AudiobookInfo]:
-        """Parse by finding all links that point to audiobook pages.
+    def _extract_title_from_node(self, node) -> Optional[str]:
+        """Extract book title from a selectolax node.
         
         Args:
-            soup: BeautifulSoup object of the page
-            base_url: Base URL for resolving relative links
+            node: Selectolax link node
             
         Returns:
-            List of AudiobookInfo objects
+            Book title or None
         """
-        audiobooks = []
-        
-        # Find all links that contain "livres-audio" in the href
-        audiobook_links = soup.find_all('a', href=lambda href: href and 'livres-audio' in href)
+        span = node.css_first('span.text')
+        if span:
+            text = span.text(deep=True).strip()
+            if len(text) > 2:
+                return text
+        
+        title_attr = node.attributes.get('title')
+        if title_attr and len(title_attr) > 2:
+            return title_attr
+        
+        text = node.text(deep=True).strip()
+        return text if len(text) > 2 else None
+    
+    def _extract_author_from_node(self, node) -> Optional[str]:
+        """Extract book author from a selectolax node.
         
-        for link in audiobook_links:
-            href = link.get('href')
-            if not href:
-                continue
-            
-            # Resolve relative URLs
-            full_url = urljoin(base_url, href)
-            
-            # Extract title and author from the link or its parent elements
-            title = self._extract_title_from_link(link)
-            author = self._extract_author_from_link(link) or "Unknown Author"
-            thumbnail_url = self._extract_thumbnail_from_link(link, base_url)
+        Args:
+            node: Selectolax link node
             
-            if title:  # Only require title, author is optional
-                book = AudiobookInfo(
-                    title=title,
-                    author=author,
-                    url=full_url,
-                    thumbnail_url=thumbnail_url
-                )
-                audiobooks.append(book)
+        Returns:
+            Book author or None
+        """
+        author_elem = node.css_first('.author, .book-author, .by-author, [data-author]')
+        if author_elem:
+            text = author_elem.text(deep=True).strip()
+            text = text.replace('par ', '').replace('by ', '').strip()
+            if len(text) > 1:
+                return text
+        return None
+    
+    def _extract_thumbnail_from_node(self, node, base_url: str) -> Optional[str]:
+        """Extract thumbnail URL from a selectolax node.
         
-        return audiobooks
+        Args:
+            node: Selectolax link node
+            base_url: Base URL for resolving relative URLs
+            
+        Returns:
+            Thumbnail URL or None
+        """
+        img = node.css_first('img')
+        if img:
+            src = img.attributes.get('src') or img.attributes.get('data-src')
+            if src:
+                return _resolve_url(base_url, src)
+        return None
     
-    def _extract_book_info_from_element(self, element, base_url: str) -> Optional[AudiobookInfo]:
+    def _extract_book_info_from_element(self, element, base_url: str, anchor=None) -> Optional[AudiobookInfo]:
         """Extract audiobook information from a DOM element.
         
         Args:
             element: BeautifulSoup element containing book information
             base_url: Base URL for resolving relative links
+            anchor: Specific audiobook link to extract; found in the
+                element when omitted
             
         Returns:
             AudiobookInfo object or None if extraction failed
         """
-        # Find the main link
-        link = element.find('a', href=lambda href: href and 'livres-audio' in href)
+        # Find the main link unless the caller already has it
+        # The precompiled attribute-substring selector runs in soupsieve's
+        # matcher instead of invoking a Python callback per anchor
+        link = anchor if anchor is not None else next(_AUDIOBOOK_LINK.iselect(element), None)
         if not link:
             return None
         
@@ -284,7 +384,7 @@ class CategoryScraper:
         if not href:
             return None
         
-        full_url = urljoin(base_url, href)
+        full_url = _resolve_url(base_url, href)
         
         # Extract title and author
         title = self._extract_title_from_link(link)
@@ -293,7 +393,7 @@ class CategoryScraper:
         description = self._extract_description_from_element(element)
         
         if not title:
-            self.logger.debug(f"No title found for book")
+            self.logger.debug("No title found for book")
             return None
         
         return AudiobookInfo(
@@ -313,28 +413,44 @@ class CategoryScraper:
         Returns:
             Book title or None
         """
-        # Try different methods to extract title, prioritizing OHdio-specific selectors
-        methods = [
-            lambda: link.find('span', class_='text'),  # OHdio specific
-            lambda: link.get('title'),
-            lambda: link.get_text(strip=True),
-            lambda: link.find('h1'),
-            lambda: link.find('h2'),
-            lambda: link.find('h3'),
-            lambda: link.find('h4'),
-            lambda: link.find('.title'),
-            lambda: link.find('.book-title'),
-        ]
-        
-        for method in methods:
-            try:
-                result = method()
-                if result:
-                    text = result.get_text(strip=True) if hasattr(result, 'get_text') else str(result)
-                    if text and len(text) > 2:
-                        return text
-            except:
+        # Cheap O(1) attribute lookup first
+        title_attr = link.get('title')
+        if title_attr:
+            title_attr = title_attr.strip()
+            if len(title_attr) > 2:
+                return title_attr
+        
+        # Walk the subtree once, collecting candidates in priority order:
+        # span.text (OHdio specific) wins immediately, then headings, then
+        # .title/.book-title classed elements
+        heading_text = None
+        classed_text = None
+        for node in link.descendants:
+            name = getattr(node, 'name', None)
+            if name is None:
                 continue
+            classes = node.get('class') or ()
+            if name == 'span' and 'text' in classes:
+                text = node.get_text(strip=True)
+                if len(text) > 2:
+                    return text
+            if heading_text is None and name in ('h1', 'h2', 'h3', 'h4'):
+                text = node.get_text(strip=True)
+                if len(text) > 2:
+                    heading_text = text
+            if classed_text is None and ('title' in classes or 'book-title' in classes):
+                text = node.get_text(strip=True)
+                if len(text) > 2:
+                    classed_text = text
+        
+        if heading_text:
+            return heading_text
+        if classed_text:
+            return classed_text
+        
+        text = link.get_text(strip=True)
+        if len(text) > 2:
+            return text
         
         # Try parent elements
         parent = link.parent
@@ -365,40 +481,25 @@ class CategoryScraper:
             if not element:
                 continue
             
-            # Try different selectors for author
-            author_selectors = [
-                '.author',
-                '.book-author',
-                '.by-author',
-                'p:contains("par")',
-                'span:contains("par")',
-                '[data-author]',
-            ]
-            
-            for selector in author_selectors:
-                try:
-                    author_elem = element.select_one(selector)
-                    if author_elem:
-                        text = author_elem.get_text(strip=True)
-                        # Clean up author text (remove "par", "by", etc.)
-                        text = text.replace('par ', '').replace('by ', '').strip()
-                        if text and len(text) > 1:
-                            return text
-                except:
-                    continue
+            # One traversal over the precompiled compound author selector
+            author_elem = next(_AUTHOR_SELECTOR.iselect(element), None)
+            if author_elem:
+                text = author_elem.get_text(strip=True)
+                # Clean up author text (remove "par", "by", etc.)
+                text = text.replace('par ', '').replace('by ', '').strip()
+                if text and len(text) > 1:
+                    return text
             
             # Try to find author in sibling elements
             if element.parent:
                 siblings = element.parent.find_all(['p', 'span', 'div'])
                 for sibling in siblings:
                     text = sibling.get_text(strip=True)
-                    if any(keyword in text.lower() for keyword in ['par ', 'by ', 'auteur']):
-                        # Extract author name
-                        for keyword in ['par ', 'by ', 'auteur: ']:
-                            if keyword in text.lower():
-                                author = text.lower().split(keyword, 1)[1].strip()
-                                if author:
-                                    return author.title()
+                    match = _AUTHOR_RX.search(text)
+                    if match:
+                        author = match.group(1).strip()
+                        if author:
+                            return author.title()
         
         return None
     
@@ -424,7 +525,7 @@ class CategoryScraper:
             if img:
                 src = img.get('src') or img.get('data-src')
                 if src:
-                    return urljoin(base_url, src)
+                    return _resolve_url(base_url, src)
         
         return None
     
@@ -437,24 +538,13 @@ class CategoryScraper:
         Returns:
             Book description or None
         """
-        # Look for description in various places
-        desc_selectors = [
-            '.description',
-            '.summary',
-            '.excerpt',
-            'p.description',
-            '[data-description]',
-        ]
-        
-        for selector in desc_selectors:
-            try:
-                desc_elem = element.select_one(selector)
-                if desc_elem:
-                    text = desc_elem.get_text(strip=True)
-                    if text and len(text) > 10:
-                        return text
-            except:
-                continue
+        # Look for description using the precompiled selectors
+        for selector in _DESC_SELECTORS:
+            desc_elem = next(selector.iselect(element), None)
+            if desc_elem:
+                text = desc_elem.get_text(strip=True)
+                if text and len(text) > 10:
+                    return text
         
         return None
     
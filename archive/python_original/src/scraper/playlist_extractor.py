@@ -9,15 +9,50 @@ This module extracts m3u8 playlist URLs from OHdio audiobook pages by:
 import re
 import json
 import logging
+import os
 from typing import Optional, Union
 from urllib.parse import urljoin
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
 
 logger = logging.getLogger(__name__)
 
 
+# Media-ID patterns compiled once at import; compiling per call costs
+# tens of microseconds each, which matters across batch discovery
+_MEDIA_ID_PATTERNS = (
+    re.compile(r'"mediaId"\s*:\s*"([^"]+)"', re.IGNORECASE),
+    re.compile(r'"mediaId"\s*:\s*(\d+)', re.IGNORECASE),
+    re.compile(r'mediaId["\']?\s*:\s*["\']?([^",\s}]+)', re.IGNORECASE),
+    re.compile(r'media-id["\']?\s*:\s*["\']?([^",\s}]+)', re.IGNORECASE),
+)
+
+# Numeric IDs that could be media IDs (7-8 digits)
+_NUMERIC_ID_RE = re.compile(r'\b(\d{7,8})\b')
+
+# A playlist URL embedded verbatim in markup or script text
+_M3U8_URL_RE = re.compile(r'https?://[^\s"\'<>]+\.m3u8[^\s"\'<>]*')
+
+# Elements with media-related data attributes
+_DATA_ID_SELECTORS = (
+    '[data-media-id]',
+    '[data-mediaid]',
+    '[data-id]',
+    '.media-player[data-id]',
+    '.audio-player[data-id]',
+    '.listen-button[data-id]',
+    '.play-button[data-id]',
+)
+_DATA_ID_ATTRS = ('data-media-id', 'data-mediaid', 'data-id')
+
+
 class PlaylistExtractor:
     """Extract m3u8 playlist URLs from OHdio audiobook pages using the API."""
     
@@ -47,67 +82,82 @@ class PlaylistExtractor:
         """
         logger.debug(f"Extracting media ID from {url}")
         
-        # Method 1: Look for mediaId in JSON data
-        media_id_patterns = [
-            r'"mediaId"\s*:\s*"([^"]+)"',
-            r'"mediaId"\s*:\s*(\d+)',
-            r'mediaId["\']?\s*:\s*["\']?([^",\s}]+)',
-            r'media-id["\']?\s*:\s*["\']?([^",\s}]+)',
-        ]
-        
-        for pattern in media_id_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            if matches:
-                media_id = matches[0].strip('"\'')
-                logger.debug(f"Found media ID using pattern {pattern}: {media_id}")
+        # Method 1: Look for mediaId in JSON data; search stops at the
+        # first hit instead of collecting every match like findall
+        for pattern in _MEDIA_ID_PATTERNS:
+            match = pattern.search(html_content)
+            if match:
+                media_id = match.group(1).strip('"\'')
+                logger.debug(f"Found media ID using pattern {pattern.pattern}: {media_id}")
+                return media_id
+        
+        # Methods 2 and 3 need a parsed DOM; Lexbor (selectolax) does both
+        # in a single fast parse, BeautifulSoup remains the fallback
+        if HAS_SELECTOLAX and not os.getenv('OHDIO_FORCE_BS4'):
+            media_id = self._extract_media_id_lexbor(html_content)
+            if media_id:
                 return media_id
+            logger.warning(f"Could not extract media ID from {url}")
+            return None
         
         # Method 2: Parse HTML and look for data attributes
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
             
-            # Look for elements with media-related data attributes
-            selectors = [
-                '[data-media-id]',
-                '[data-mediaid]',
-                '[data-id]',
-                '.media-player[data-id]',
-                '.audio-player[data-id]',
-                '.listen-button[data-id]',
-                '.play-button[data-id]',
-            ]
-            
-            for selector in selectors:
+            for selector in _DATA_ID_SELECTORS:
                 elements = soup.select(selector)
                 for element in elements:
-                    for attr in ['data-media-id', 'data-mediaid', 'data-id']:
+                    for attr in _DATA_ID_ATTRS:
                         value = element.get(attr)
                         if value and value.isdigit():
                             logger.debug(f"Found media ID in {selector} {attr}: {value}")
                             return value
+            
+            # Method 3: Look for numeric IDs in script tags
+            for script in soup.find_all('script'):
+                if script.string:
+                    match = _NUMERIC_ID_RE.search(script.string)
+                    if match:
+                        media_id = match.group(1)
+                        logger.debug(f"Found potential media ID in script: {media_id}")
+                        return media_id
         
         except Exception as e:
             logger.warning(f"Error parsing HTML for media ID: {e}")
         
-        # Method 3: Look for numeric IDs in script tags
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            scripts = soup.find_all('script')
+        logger.warning(f"Could not extract media ID from {url}")
+        return None
+    
+    def _extract_media_id_lexbor(self, html_content: str) -> Optional[str]:
+        """Find the media ID in the DOM using the Lexbor C parser.
+        
+        Args:
+            html_content: The HTML content of the page
             
-            for script in scripts:
-                if script.string:
-                    # Look for numeric IDs that could be media IDs (7-8 digits)
-                    numeric_ids = re.findall(r'\b(\d{7,8})\b', script.string)
-                    if numeric_ids:
-                        # Take the first one that looks like a media ID
-                        for media_id in numeric_ids:
-                            logger.debug(f"Found potential media ID in script: {media_id}")
-                            return media_id
+        Returns:
+            The mediaId if found, None otherwise
+        """
+        tree = LexborHTMLParser(html_content)
         
-        except Exception as e:
-            logger.warning(f"Error parsing scripts for media ID: {e}")
+        # Elements with media-related data attributes
+        for selector in _DATA_ID_SELECTORS:
+            for node in tree.css(selector):
+                for attr in _DATA_ID_ATTRS:
+                    value = node.attributes.get(attr)
+                    if value and value.isdigit():
+                        logger.debug(f"Found media ID in {selector} {attr}: {value}")
+                        return value
+        
+        # Numeric IDs in script tags
+        for script in tree.css('script'):
+            text = script.text()
+            if text:
+                match = _NUMERIC_ID_RE.search(text)
+                if match:
+                    media_id = match.group(1)
+                    logger.debug(f"Found potential media ID in script: {media_id}")
+                    return media_id
         
-        logger.warning(f"Could not extract media ID from {url}")
         return None
     
     def get_playlist_from_api(self, media_id: str) -> Optional[str]:
@@ -201,6 +251,16 @@ class PlaylistExtractor:
         """
         logger.info(f"Extracting playlist URL from: {url}")
         
+        # Fast path: some pages embed the playlist URL verbatim, which
+        # needs no DOM walk and no API round-trip. The substring test
+        # gates the regex so pages without one pay a single cheap scan
+        if '.m3u8' in html_content:
+            match = _M3U8_URL_RE.search(html_content)
+            if match:
+                playlist_url = match.group(0)
+                logger.info(f"Found embedded m3u8 URL: {playlist_url}")
+                return playlist_url
+        
         # Step 1: Extract the media ID
         media_id = self.extract_media_id(html_content, url)
         if not media_id:
@@ -0,0 +1,69 @@
+"""Concurrency primitives for the OHdio audiobook downloader."""
+
+import asyncio
+
+
+class AdmissionController:
+    """Counting limiter whose capacity can change while tasks run.
+
+    asyncio.Semaphore bakes its count in at construction, so a running
+    pipeline cannot shrink concurrency when the server starts returning
+    429s, or grow it back once responses recover. This wraps an explicit
+    active count and a target limit in a Condition, which makes the limit
+    safe to adjust at any time.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize the controller.
+
+        Args:
+            limit: Initial maximum number of concurrent holders
+
+        Raises:
+            ValueError: If limit is less than 1
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self._limit = limit
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current maximum number of concurrent holders."""
+        return self._limit
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free, then claim it."""
+        async with self._cond:
+            while self._active >= self._limit:
+                await self._cond.wait()
+            self._active += 1
+
+    async def release(self) -> None:
+        """Return a slot and wake one waiter."""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        """Adjust the limit, waking all waiters when it grows.
+
+        A shrunken limit takes effect as running holders release; nothing
+        is cancelled mid-flight.
+
+        Args:
+            limit: New maximum, clamped to at least 1
+        """
+        async with self._cond:
+            grew = limit > self._limit
+            self._limit = max(1, limit)
+            if grew:
+                self._cond.notify_all()
+
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.release()
@@ -6,6 +6,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 @dataclass
 class Config:
@@ -13,21 +19,27 @@ class Config:
     
     output_directory: str = "downloads"
     max_concurrent_downloads: int = 3
+    scrape_concurrency: int = 10
     retry_attempts: int = 3
     delay_between_requests: float = 1.0
     audio_quality: str = "best"
     embed_metadata: bool = True
     skip_existing: bool = True
+    cover_max_size: int = 300
     user_agent: str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
     
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         if self.max_concurrent_downloads < 1:
             raise ValueError("max_concurrent_downloads must be at least 1")
+        if self.scrape_concurrency < 1:
+            raise ValueError("scrape_concurrency must be at least 1")
         if self.retry_attempts < 0:
             raise ValueError("retry_attempts must be non-negative")
         if self.delay_between_requests < 0:
             raise ValueError("delay_between_requests must be non-negative")
+        if self.cover_max_size < 1:
+            raise ValueError("cover_max_size must be at least 1")
 
         # Ensure output directory exists
         try:
@@ -59,10 +71,14 @@ class Config:
             return cls()
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # orjson parses several times faster than stdlib json; the
+            # config is read on every CLI invocation, so this trims startup
+            if HAS_ORJSON:
+                data = orjson.loads(config_path.read_bytes())
+            else:
+                data = json.loads(config_path.read_text(encoding='utf-8'))
             return cls(**data)
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, ValueError) as e:
             logging.error(f"Invalid JSON in config file {config_file}: {e}")
             raise
     
@@ -79,11 +95,13 @@ class Config:
         data = {
             'output_directory': self.output_directory,
             'max_concurrent_downloads': self.max_concurrent_downloads,
+            'scrape_concurrency': self.scrape_concurrency,
             'retry_attempts': self.retry_attempts,
             'delay_between_requests': self.delay_between_requests,
             'audio_quality': self.audio_quality,
             'embed_metadata': self.embed_metadata,
             'skip_existing': self.skip_existing,
+            'cover_max_size': self.cover_max_size,
             'user_agent': self.user_agent,
         }
         
@@ -0,0 +1,58 @@
+"""Shared aiohttp session management for the OHdio audiobook downloader."""
+
+import logging
+from typing import Dict, Optional
+
+import aiohttp
+
+
+# Default headers applied to the shared session
+DEFAULT_HEADERS: Dict[str, str] = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'fr-CA,fr;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Get the shared ClientSession, creating it lazily on first use.
+
+    A single pooled session keeps TCP connections and TLS sessions alive
+    across requests, so repeated fetches against the same host skip the
+    handshake and slow-start cost paid by per-request sessions.
+
+    Returns:
+        The shared aiohttp.ClientSession
+    """
+    global _session
+
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                # Keep resolved addresses for the whole run instead of the
+                # 10 s default, so one lookup covers a batch of requests
+                ttl_dns_cache=600,
+                use_dns_cache=True,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=60, connect=10),
+            headers=DEFAULT_HEADERS
+        )
+        logging.getLogger(__name__).debug("Created shared HTTP session")
+
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session. Call on application shutdown."""
+    global _session
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
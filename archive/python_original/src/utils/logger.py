@@ -1,11 +1,42 @@
 """Logging setup and utilities for the OHdio audiobook downloader."""
 
+import contextvars
 import json
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+    _ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Background listener draining log records to the file handler
+_queue_listener: Optional[QueueListener] = None
+
+# Per-task extras attached to log records by _ContextExtrasFilter
+_log_extras: contextvars.ContextVar = contextvars.ContextVar('_log_extras', default=None)
+
+
+class _ContextExtrasFilter(logging.Filter):
+    """Attach the active LoggingContext extras to each record."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        extras = _log_extras.get()
+        if extras:
+            for key, value in extras.items():
+                setattr(record, key, value)
+        return True
+
+
+_context_filter = _ContextExtrasFilter()
 
 
 class JSONFormatter(logging.Formatter):
@@ -20,24 +51,48 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "level": record.levelname,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-        }
+        if HAS_ORJSON:
+            log_entry = {
+                "level": record.levelname,
+                "message": record.getMessage(),
+                "module": record.module,
+                "function": record.funcName,
+                "line": record.lineno,
+            }
+            
+            # Add extra fields if they exist
+            if hasattr(record, 'url'):
+                log_entry['url'] = record.url
+            if hasattr(record, 'duration'):
+                log_entry['duration'] = record.duration
+            if hasattr(record, 'status_code'):
+                log_entry['status_code'] = record.status_code
+            
+            # orjson serialises the datetime natively and appends the Z,
+            # skipping the per-record isoformat call
+            log_entry["timestamp"] = datetime.utcnow()
+            return orjson.dumps(log_entry, option=_ORJSON_OPTS).decode()
+        
+        # Stdlib fallback: the record layout is fixed, so assemble the line
+        # directly and json-escape only the fields that can contain
+        # arbitrary text (message, url) instead of encoding a whole dict
+        parts = [
+            '{"level":"', record.levelname,
+            '","message":', json.dumps(record.getMessage(), ensure_ascii=False),
+            ',"module":"', record.module,
+            '","function":"', record.funcName,
+            '","line":', str(record.lineno),
+        ]
         
-        # Add extra fields if they exist
         if hasattr(record, 'url'):
-            log_entry['url'] = record.url
+            parts += [',"url":', json.dumps(record.url, ensure_ascii=False)]
         if hasattr(record, 'duration'):
-            log_entry['duration'] = record.duration
+            parts += [',"duration":', repr(record.duration)]
         if hasattr(record, 'status_code'):
-            log_entry['status_code'] = record.status_code
+            parts += [',"status_code":', str(record.status_code)]
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        parts += [',"timestamp":"', datetime.utcnow().isoformat(), 'Z"}']
+        return ''.join(parts)
 
 
 class ColoredConsoleFormatter(logging.Formatter):
@@ -53,6 +108,10 @@ class ColoredConsoleFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    # Timestamp cache: records in the same second reuse the formatted string
+    _last_ts_int = -1
+    _last_ts_str = ''
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors for console output.
         
@@ -65,8 +124,14 @@ class ColoredConsoleFormatter(logging.Formatter):
         # Get color for log level
         color = self.COLORS.get(record.levelname, '')
         
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S')
+        # Format timestamp, reusing the cached string within the same second
+        # (fromtimestamp + strftime are costly at thousands of records)
+        sec = int(record.created)
+        cls = self.__class__
+        if sec != cls._last_ts_int:
+            cls._last_ts_str = datetime.fromtimestamp(sec).strftime('%H:%M:%S')
+            cls._last_ts_int = sec
+        timestamp = cls._last_ts_str
         
         # Format the message
         formatted = (
@@ -92,22 +157,34 @@ def setup_logging(
         console_output: Whether to output to console
         json_format: Whether to use JSON format for console output
     """
+    global _queue_listener
+    
     # Create logs directory if it doesn't exist
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Remove existing handlers
+    # Remove existing handlers and stop any previous listener
     logger = logging.getLogger()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
     
     # Set log level
     logger.setLevel(getattr(logging, log_level.upper()))
     
-    # File handler with JSON format
+    # File handler with JSON format, decoupled from callers by a queue so
+    # JSON formatting and file writes happen on a background thread instead
+    # of stalling the parse and download loops
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setFormatter(JSONFormatter())
-    logger.addHandler(file_handler)
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(_context_filter)
+    logger.addHandler(queue_handler)
+    _queue_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _queue_listener.start()
     
     # Console handler
     if console_output:
@@ -116,6 +193,7 @@ def setup_logging(
             console_handler.setFormatter(JSONFormatter())
         else:
             console_handler.setFormatter(ColoredConsoleFormatter())
+        console_handler.addFilter(_context_filter)
         logger.addHandler(console_handler)
     
     # Reduce noise from external libraries
@@ -126,6 +204,15 @@ def setup_logging(
     logging.info(f"Logging initialized with level {log_level}")
 
 
+def shutdown_logging() -> None:
+    """Stop the background log listener, flushing queued records to disk."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def log_request(url: str, status_code: int, duration: float) -> None:
     """Log HTTP request details.
     
@@ -182,22 +269,20 @@ class LoggingContext:
             **kwargs: Extra fields to add to log records
         """
         self.extra = kwargs
-        self.old_factory = None
+        self.token = None
     
     def __enter__(self) -> 'LoggingContext':
-        """Enter the context and modify log record factory."""
-        self.old_factory = logging.getLogRecordFactory()
+        """Enter the context, exposing the extras to the log filter.
         
-        def record_factory(*args, **kwargs):
-            record = self.old_factory(*args, **kwargs)
-            for key, value in self.extra.items():
-                setattr(record, key, value)
-            return record
-        
-        logging.setLogRecordFactory(record_factory)
+        Extras live in a ContextVar, so concurrent asyncio tasks each see
+        their own values instead of racing over the global record factory.
+        """
+        current = _log_extras.get() or {}
+        self.token = _log_extras.set({**current, **self.extra})
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit the context and restore original log record factory."""
-        if self.old_factory:
-            logging.setLogRecordFactory(self.old_factory) 
\ No newline at end of file
+        """Exit the context and restore the previous extras."""
+        if self.token is not None:
+            _log_extras.reset(self.token)
+            self.token = None
@@ -1,14 +1,21 @@
 """Network utilities for the OHdio audiobook downloader."""
 
 import asyncio
+import gzip
+import hashlib
 import logging
+import os
+import random
 import time
+from pathlib import Path
 from typing import Dict, Optional, Any
 
 import aiohttp
 import requests
 from aiohttp import ClientError, ClientTimeout
 
+from .http_client import DEFAULT_HEADERS, get_session
+
 
 class NetworkError(Exception):
     """Custom exception for network-related errors."""
@@ -20,6 +27,50 @@ class RateLimitError(NetworkError):
     pass
 
 
+# On-disk HTML cache so repeat runs within the TTL skip the network
+# entirely. Off by default so production runs always see live pages;
+# the test scripts opt in by setting OHDIO_HTTP_CACHE_TTL (seconds).
+_CACHE_DIR = Path(os.getenv('OHDIO_HTTP_CACHE', str(Path.home() / '.cache' / 'ohdio')))
+_CACHE_TTL = float(os.getenv('OHDIO_HTTP_CACHE_TTL', '0'))
+
+
+def _cache_path(url: str) -> Path:
+    """Return the cache file path for a URL."""
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return _CACHE_DIR / key[:2] / f"{key}.html.gz"
+
+
+def _cache_get(url: str) -> Optional[str]:
+    """Return cached HTML for the URL if present and fresh, else None."""
+    path = _cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime < _CACHE_TTL:
+            return gzip.decompress(path.read_bytes()).decode('utf-8')
+    except (OSError, gzip.BadGzipFile):
+        pass
+    return None
+
+
+def _cache_put(url: str, html: str) -> None:
+    """Store HTML for the URL in the cache; failures are non-fatal."""
+    path = _cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(gzip.compress(html.encode('utf-8')))
+    except OSError:
+        pass
+
+
+def _backoff_delay(base_delay: float, attempt: int) -> float:
+    """Exponential backoff with full jitter.
+    
+    Randomizing over [0, base * 2^attempt] spreads retries out so
+    concurrent callers hitting the same failure don't thunder back in
+    lockstep at the same instant.
+    """
+    return random.uniform(0, base_delay * (2 ** attempt))
+
+
 async def safe_request(
     url: str,
     method: str = "GET",
@@ -27,6 +78,7 @@ async def safe_request(
     max_retries: int = 3,
     delay: float = 1.0,
     timeout: float = 30.0,
+    session: Optional[aiohttp.ClientSession] = None,
     **kwargs: Any
 ) -> Optional[str]:
     """Make HTTP request with retry logic and error handling.
@@ -38,6 +90,7 @@ async def safe_request(
         max_retries: Maximum number of retry attempts
         delay: Base delay between retries in seconds
         timeout: Request timeout in seconds
+        session: aiohttp session to use (defaults to the shared pooled one)
         **kwargs: Additional arguments passed to aiohttp
         
     Returns:
@@ -49,74 +102,88 @@ async def safe_request(
     """
     logger = logging.getLogger(__name__)
     
+    # Fresh cached copies short-circuit the network for repeat GETs
+    use_cache = method.upper() == "GET" and _CACHE_TTL > 0
+    if use_cache:
+        cached = _cache_get(url)
+        if cached is not None:
+            logger.debug(f"HTML cache hit for {url}")
+            return cached
+    
     if headers is None:
         headers = {}
     
     # Add default headers if not present
-    default_headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'fr-CA,fr;q=0.9,en;q=0.8',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-    }
-    
-    for key, value in default_headers.items():
+    for key, value in DEFAULT_HEADERS.items():
         if key not in headers:
             headers[key] = value
     
+    # Reuse the shared pooled session so retries and subsequent requests
+    # ride existing keep-alive connections instead of re-handshaking
+    if session is None:
+        session = await get_session()
+    
     timeout_config = ClientTimeout(total=timeout)
     
     for attempt in range(max_retries + 1):
         start_time = time.time()
         
         try:
-            async with aiohttp.ClientSession(timeout=timeout_config) as session:
-                async with session.request(method, url, headers=headers, **kwargs) as response:
-                    duration = time.time() - start_time
+            async with session.request(method, url, headers=headers, timeout=timeout_config, **kwargs) as response:
+                duration = time.time() - start_time
                     
-                    # Log the request
-                    from .logger import log_request
-                    log_request(url, response.status, duration)
+                # Log the request
+                from .logger import log_request
+                log_request(url, response.status, duration)
                     
-                    if response.status == 200:
-                        content = await response.text()
+                if response.status == 200:
+                    content = await response.text()
+                    if content:
+                        if use_cache:
+                            _cache_put(url, content)
                         return content
-                    elif response.status == 429:  # Rate limited
-                        retry_after = response.headers.get('Retry-After', str(delay * (2 ** attempt)))
-                        wait_time = float(retry_after)
-                        logger.warning(f"Rate limited, waiting {wait_time}s before retry")
+                    # Empty bodies from this host behave like rate limiting;
+                    # treat them as transient rather than a final answer
+                    logger.debug(f"Empty response body for {url} (attempt {attempt + 1})")
+                    if attempt < max_retries:
+                        await asyncio.sleep(_backoff_delay(delay, attempt))
+                        continue
+                    return None
+                elif response.status == 429:  # Rate limited
+                    retry_after = response.headers.get('Retry-After', str(delay * (2 ** attempt)))
+                    wait_time = float(retry_after)
+                    logger.warning(f"Rate limited, waiting {wait_time}s before retry")
                         
-                        if attempt < max_retries:
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            raise RateLimitError(f"Rate limited and retries exhausted for {url}")
-                    elif response.status >= 500:  # Server error
-                        logger.warning(f"Server error {response.status} for {url}, attempt {attempt + 1}")
-                        if attempt < max_retries:
-                            await asyncio.sleep(delay * (2 ** attempt))
-                            continue
-                        else:
-                            raise NetworkError(f"Server error {response.status} for {url}")
-                    elif response.status == 404:
-                        logger.error(f"Resource not found: {url}")
-                        return None
-                    elif response.status >= 400:
-                        logger.error(f"Client error {response.status} for {url}")
-                        return None
+                    if attempt < max_retries:
+                        await asyncio.sleep(wait_time)
+                        continue
+                    else:
+                        raise RateLimitError(f"Rate limited and retries exhausted for {url}")
+                elif response.status >= 500:  # Server error
+                    logger.warning(f"Server error {response.status} for {url}, attempt {attempt + 1}")
+                    if attempt < max_retries:
+                        await asyncio.sleep(_backoff_delay(delay, attempt))
+                        continue
+                    else:
+                        raise NetworkError(f"Server error {response.status} for {url}")
+                elif response.status == 404:
+                    logger.error(f"Resource not found: {url}")
+                    return None
+                elif response.status >= 400:
+                    logger.error(f"Client error {response.status} for {url}")
+                    return None
                     
         except ClientError as e:
             logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
             if attempt < max_retries:
-                await asyncio.sleep(delay * (2 ** attempt))
+                await asyncio.sleep(_backoff_delay(delay, attempt))
                 continue
             else:
                 raise NetworkError(f"Network error after {max_retries} retries: {e}")
         except asyncio.TimeoutError:
             logger.warning(f"Request timeout for {url} (attempt {attempt + 1})")
             if attempt < max_retries:
-                await asyncio.sleep(delay * (2 ** attempt))
+                await asyncio.sleep(_backoff_delay(delay, attempt))
                 continue
             else:
                 raise NetworkError(f"Timeout after {max_retries} retries for {url}")
@@ -157,15 +224,7 @@ def sync_request(
         headers = {}
     
     # Add default headers if not present
-    default_headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'fr-CA,fr;q=0.9,en;q=0.8',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-    }
-    
-    for key, value in default_headers.items():
+    for key, value in DEFAULT_HEADERS.items():
         if key not in headers:
             headers[key] = value
     
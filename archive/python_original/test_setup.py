@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
-"""Test script to verify OHdio downloader setup."""
+"""Setup verification tests for the OHdio downloader.
 
+Collected by pytest so independent checks can run in parallel with
+pytest-xdist (`pytest -n auto test_setup.py`); running the file
+directly delegates to pytest for the same behaviour.
+"""
+
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -9,176 +15,114 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 def test_imports():
     """Test that all modules can be imported."""
-    try:
-        print("Testing imports...")
-        
-        # Test utils
-        from src.utils.config import Config
-        from src.utils.logger import setup_logging
-        from src.utils.file_utils import sanitize_filename
-        from src.utils.network_utils import sync_request
-        print("✓ Utils imports successful")
-        
-        # Test scrapers
-        from src.scraper.category_scraper import CategoryScraper
-        from src.scraper.audiobook_scraper import AudiobookScraper
-        from src.scraper.playlist_extractor import PlaylistExtractor
-        print("✓ Scraper imports successful")
-        
-        # Test downloaders
-        from src.downloader.ytdlp_downloader import YtDlpDownloader
-        from src.downloader.metadata_manager import MetadataManager
-        print("✓ Downloader imports successful")
-        
-        # Test main
-        from src.main import OHdioDownloader
-        print("✓ Main imports successful")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"✗ Import failed: {e}")
-        return False
+    print("Testing imports...")
+
+    # Test utils
+    from src.utils.config import Config
+    from src.utils.logger import setup_logging
+    from src.utils.file_utils import sanitize_filename
+    from src.utils.network_utils import sync_request
+    print("✓ Utils imports successful")
+
+    # Test scrapers
+    from src.scraper.category_scraper import CategoryScraper
+    from src.scraper.audiobook_scraper import AudiobookScraper
+    from src.scraper.playlist_extractor import PlaylistExtractor
+    print("✓ Scraper imports successful")
+
+    # Test downloaders
+    from src.downloader.ytdlp_downloader import YtDlpDownloader
+    from src.downloader.metadata_manager import MetadataManager
+    print("✓ Downloader imports successful")
+
+    # Test main
+    from src.main import OHdioDownloader
+    print("✓ Main imports successful")
 
 def test_config():
     """Test configuration loading."""
-    try:
-        print("\nTesting configuration...")
-        from src.utils.config import Config
-        
-        # Test default config
-        config = Config()
-        print(f"✓ Default config created: output_dir={config.output_directory}")
-        
-        # Test config validation
-        config.max_concurrent_downloads = 2
-        config.retry_attempts = 3
-        print("✓ Config validation passed")
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Config test failed: {e}")
-        return False
+    print("\nTesting configuration...")
+    from src.utils.config import Config
+
+    # Test default config
+    config = Config()
+    assert config.output_directory
+    print(f"✓ Default config created: output_dir={config.output_directory}")
+
+    # Test config validation
+    config.max_concurrent_downloads = 2
+    config.retry_attempts = 3
+    print("✓ Config validation passed")
 
 def test_file_utils():
     """Test file utilities."""
-    try:
-        print("\nTesting file utilities...")
-        from src.utils.file_utils import sanitize_filename, format_audiobook_filename
-        
-        # Test filename sanitization
-        safe_name = sanitize_filename("Test <Book> Title: Part/1")
-        print(f"✓ Filename sanitization: {safe_name}")
-        
-        # Test audiobook filename formatting
-        audiobook_name = format_audiobook_filename("Test Title", "Test Author")
-        print(f"✓ Audiobook filename: {audiobook_name}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ File utils test failed: {e}")
-        return False
+    print("\nTesting file utilities...")
+    from src.utils.file_utils import sanitize_filename, format_audiobook_filename
+
+    # Test filename sanitization
+    safe_name = sanitize_filename("Test <Book> Title: Part/1")
+    assert safe_name
+    print(f"✓ Filename sanitization: {safe_name}")
+
+    # Test audiobook filename formatting
+    audiobook_name = format_audiobook_filename("Test Title", "Test Author")
+    assert audiobook_name
+    print(f"✓ Audiobook filename: {audiobook_name}")
 
 def test_dependencies():
     """Test that all required dependencies are available."""
-    try:
-        print("\nTesting dependencies...")
-        
-        import requests
-        print("✓ requests available")
-        
-        import bs4
-        print("✓ beautifulsoup4 available")
-        
-        import yt_dlp
-        print("✓ yt-dlp available")
-        
-        import mutagen
-        print("✓ mutagen available")
-        
-        import aiohttp
-        print("✓ aiohttp available")
-        
-        import PIL
-        print("✓ Pillow available")
-        
-        return True
-        
-    except ImportError as e:
-        print(f"✗ Dependency test failed: {e}")
-        print("Run: uv sync")
-        return False
-
-def test_basic_functionality():
-    """Test basic functionality."""
-    try:
-        print("\nTesting basic functionality...")
-        from src.utils.config import Config
-        from src.scraper.playlist_extractor import PlaylistExtractor
-        
-        # Test playlist extractor
-        config = Config()
-        extractor = PlaylistExtractor(config)
-        print("✓ PlaylistExtractor created")
-        
-        # Test with sample HTML
-        test_html = '''
-        <html>
-            <script>
-                var playlistUrl = "https://rcavmedias.akamaized.net/test/master.m3u8";
-            </script>
-        </html>
-        '''
-        
-        url = extractor.extract_playlist_url(test_html, "https://example.com")
-        if url:
-            print(f"✓ Playlist extraction works: {url}")
-        else:
-            print("! Playlist extraction returned None (expected for test data)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Basic functionality test failed: {e}")
-        return False
-
-def main():
-    """Run all tests."""
-    print("OHdio Downloader Setup Test")
-    print("=" * 40)
-    
-    tests = [
-        test_imports,
-        test_config,
-        test_file_utils,
-        test_dependencies,
-        test_basic_functionality
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        if test():
-            passed += 1
+    print("\nTesting dependencies...")
+
+    # find_spec only resolves each package's loader without executing its
+    # __init__, so heavyweights like yt-dlp and Pillow cost microseconds
+    # here instead of hundreds of milliseconds of real imports
+    packages = (
+        ('requests', 'requests'),
+        ('bs4', 'beautifulsoup4'),
+        ('selectolax', 'selectolax'),
+        ('yt_dlp', 'yt-dlp'),
+        ('mutagen', 'mutagen'),
+        ('aiohttp', 'aiohttp'),
+        ('PIL', 'Pillow'),
+    )
+
+    missing = []
+    for module_name, package_name in packages:
+        if importlib.util.find_spec(module_name) is not None:
+            print(f"✓ {package_name} available")
         else:
-            failed += 1
-    
-    print(f"\nTest Results: {passed} passed, {failed} failed")
-    
-    if failed == 0:
-        print("✓ All tests passed! OHdio downloader is ready to use.")
-        print("\nQuick start:")
-        print("  uv run python main.py --test https://ici.radio-canada.ca/ohdio/livres-audio/105729/augustine")
-        print("  uv run python main.py --url https://ici.radio-canada.ca/ohdio/livres-audio/105729/augustine")
-        print("  uv run python main.py")
+            print(f"✗ {package_name} missing")
+            missing.append(package_name)
+
+    assert not missing, f"Missing packages: {', '.join(missing)} - run: uv sync"
+
+def test_basic_functionality(config):
+    """Test basic functionality."""
+    print("\nTesting basic functionality...")
+    import requests
+    from src.scraper.playlist_extractor import PlaylistExtractor
+
+    # Test playlist extractor with the configured request headers
+    session = requests.Session()
+    session.headers.update(config.get_headers())
+    extractor = PlaylistExtractor(session)
+    print("✓ PlaylistExtractor created")
+
+    # Test with sample HTML
+    test_html = '''
+    <html>
+        <script>
+            var playlistUrl = "https://rcavmedias.akamaized.net/test/master.m3u8";
+        </script>
+    </html>
+    '''
+
+    url = extractor.extract_playlist_url(test_html, "https://example.com")
+    if url:
+        print(f"✓ Playlist extraction works: {url}")
     else:
-        print("✗ Some tests failed. Please check the errors above.")
-        return 1
-    
-    return 0
+        print("! Playlist extraction returned None (expected for test data)")
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    import pytest
+    sys.exit(pytest.main([__file__]))